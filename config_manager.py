@@ -5,6 +5,7 @@ Handles loading, saving, and validating settings from JSON file.
 
 import json
 import os
+import threading
 
 # Default configuration for a single instance
 DEFAULT_INSTANCE_CONFIG = {
@@ -84,6 +85,18 @@ DEFAULT_INSTANCE_CONFIG = {
 
 CONFIG_FILE = "settings.json"
 
+# One write lock per config file path, shared by every ConfigManager in the process
+# (widgets share a process, and all write the same file through the same temp path)
+_file_write_locks = {}
+_file_write_locks_guard = threading.Lock()
+
+
+def _write_lock_for(config_file):
+    """Return the process-wide write lock for config_file."""
+    key = os.path.normcase(os.path.abspath(config_file))
+    with _file_write_locks_guard:
+        return _file_write_locks.setdefault(key, threading.Lock())
+
 # Root config structure with instances
 DEFAULT_ROOT_CONFIG = {
     "active_instances": ["instance_1"],  # List of active instance IDs
@@ -96,12 +109,21 @@ DEFAULT_ROOT_CONFIG = {
 class ConfigManager:
     """Lightweight configuration manager with support for multiple instances."""
 
-    def __init__(self, config_file=CONFIG_FILE, instance_id="instance_1"):
+    def __init__(self, config_file=CONFIG_FILE, instance_id="instance_1", root_config=None):
         self.config_file = config_file
         self.instance_id = instance_id
         self.root_config = None
         self.config = None
-        self.load()
+        self._saved_config = None  # Instance config as last loaded/saved
+        self._write_lock = _write_lock_for(config_file)  # Serializes writes to this file process-wide
+        self._write_seq = 0  # Sequence number of the latest requested write
+        if root_config is None:
+            self.load()
+        else:
+            # Start from an already-parsed root config (e.g. another instance's) instead of re-reading the file
+            self.root_config = self._deep_copy(root_config)
+            self._load_instance()
+            self._saved_config = self._deep_copy(self.config)
 
     def load(self):
         """Load configuration from JSON file. Uses defaults if file doesn't exist."""
@@ -114,15 +136,7 @@ class ConfigManager:
                 if "instances" not in self.root_config:
                     self.root_config = self._migrate_to_instances(self.root_config)
 
-                # Ensure instance exists
-                if self.instance_id not in self.root_config.get("instances", {}):
-                    self.root_config["instances"][self.instance_id] = self._deep_copy(DEFAULT_INSTANCE_CONFIG)
-
-                # Load this instance's config
-                self.config = self._merge_with_defaults(
-                    self.root_config["instances"][self.instance_id],
-                    DEFAULT_INSTANCE_CONFIG
-                )
+                self._load_instance()
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load config file ({e}). Using defaults.")
                 self.root_config = self._deep_copy(DEFAULT_ROOT_CONFIG)
@@ -132,6 +146,17 @@ class ConfigManager:
             self.root_config = self._deep_copy(DEFAULT_ROOT_CONFIG)
             self.config = self._deep_copy(DEFAULT_INSTANCE_CONFIG)
             self.save()  # Create the file with defaults
+        self._saved_config = self._deep_copy(self.config)
+
+    def _load_instance(self):
+        """Ensure this instance exists in root_config and load its config merged with defaults."""
+        if self.instance_id not in self.root_config.get("instances", {}):
+            self.root_config["instances"][self.instance_id] = self._deep_copy(DEFAULT_INSTANCE_CONFIG)
+
+        self.config = self._merge_with_defaults(
+            self.root_config["instances"][self.instance_id],
+            DEFAULT_INSTANCE_CONFIG
+        )
 
     def _migrate_to_instances(self, old_config):
         """Migrate old single-instance config to new multi-instance format."""
@@ -144,17 +169,45 @@ class ConfigManager:
 
     def save(self):
         """Save current configuration to JSON file."""
-        try:
-            # Update this instance's config in root
-            self.root_config["instances"][self.instance_id] = self.config
+        # Update this instance's config in root
+        self.root_config["instances"][self.instance_id] = self.config
+
+        self._write_seq += 1
+        if self._write_file(self.root_config, self._write_seq):
+            self._saved_config = self._deep_copy(self.config)
+            return True
+        return False
+
+    def save_async(self):
+        """Save current configuration to JSON file on a background thread."""
+        # Update this instance's config in root
+        self.root_config["instances"][self.instance_id] = self.config
 
-            with open(self.config_file, 'w') as f:
-                json.dump(self.root_config, f, indent=4)
+        # Snapshot on the calling thread so later edits don't leak into the write
+        snapshot = self._deep_copy(self.root_config)
+        self._saved_config = self._deep_copy(self.config)
+        self._write_seq += 1
+        threading.Thread(target=self._write_file, args=(snapshot, self._write_seq)).start()
+
+    def _write_file(self, data, seq):
+        """Write data to the config file atomically, skipping it if a newer write was requested."""
+        temp_file = self.config_file + '.tmp'
+        try:
+            with self._write_lock:
+                if seq < self._write_seq:
+                    return True  # Superseded by a newer snapshot
+                with open(temp_file, 'w') as f:
+                    json.dump(data, f, indent=4)
+                os.replace(temp_file, self.config_file)
             return True
         except IOError as e:
             print(f"Error: Could not save config file ({e}).")
             return False
 
+    def has_unsaved_changes(self):
+        """Check whether this instance's config differs from what was last loaded or saved."""
+        return self.config != self._saved_config
+
     def get(self, category, key=None):
         """
         Get configuration value.
@@ -162,18 +215,32 @@ class ConfigManager:
             get('location', 'zip_code') -> returns "80701"
             get('location') -> returns entire location dict
         """
+        section = self.config.get(category)
         if key is None:
-            return self.config.get(category, {})
-        return self.config.get(category, {}).get(key)
+            return {} if section is None else section
+        return None if section is None else section.get(key)
 
     def set(self, category, key, value):
         """
         Set configuration value.
         Usage: set('location', 'zip_code', '90210')
         """
-        if category not in self.config:
-            self.config[category] = {}
-        self.config[category][key] = value
+        section = self.config.get(category)
+        if section is None:
+            section = self.config[category] = {}
+        section[key] = value
+
+    def update_many(self, items):
+        """
+        Set several configuration values in one pass.
+        Usage: update_many({('fonts', 'family'): 'Arial', ('fonts', 'time_size'): 48})
+        """
+        config = self.config
+        for (category, key), value in items.items():
+            section = config.get(category)
+            if section is None:
+                section = config[category] = {}
+            section[key] = value
 
     def get_all(self):
         """Get entire configuration dictionary."""
@@ -228,6 +295,7 @@ class ConfigManager:
                 self.root_config["instances"][instance_id],
                 DEFAULT_INSTANCE_CONFIG
             )
+            self._saved_config = self._deep_copy(self.config)
             return True
         return False
 
@@ -3,12 +3,44 @@ Settings Window for TimeDateWeather Desktop Widget
 Provides GUI for configuring all widget settings with hybrid preview mode.
 """
 
+import json
 import tkinter as tk
+from contextlib import contextmanager
+from functools import partial
 from tkinter import ttk, colorchooser, messagebox, filedialog
 from config_manager import ConfigManager
-from themes import THEMES, get_theme, get_theme_names, apply_theme_to_config
+from themes import THEMES, THEME_NAME_TO_ID, get_theme, get_theme_names, apply_theme_to_config
 from notifications import ToolTip, show_toast
 
+# Date format choices: (display name, strftime format)
+_DATE_FORMATS = (
+    ("Full (Saturday, January 11)", "%A, %B %d"),
+    ("Short (Sat, Jan 11)", "%a, %b %d"),
+    ("Numeric (01/11/2025)", "%m/%d/%Y"),
+    ("ISO (2025-01-11)", "%Y-%m-%d"),
+    ("European (11 January 2025)", "%d %B %Y"),
+    ("Minimal (Jan 11)", "%b %d")
+)
+_DATE_FORMAT_NAMES = [name for name, _ in _DATE_FORMATS]
+_DATE_FORMAT_BY_NAME = dict(_DATE_FORMATS)
+_DATE_NAME_BY_FORMAT = {fmt: name for name, fmt in _DATE_FORMATS}
+
+# Spacing slider rows (spacing key, label) and slider range per axis
+_SPACING_ROWS = (
+    ('status_x', "Status X:"),
+    ('status_y', "Status Y:"),
+    ('time_x', "Time X:"),
+    ('time_y', "Time Y:"),
+    ('date_x', "Date X:"),
+    ('date_y', "Date Y:"),
+    ('weather_x', "Weather X:"),
+    ('weather_y', "Weather Y:")
+)
+_SPACING_RANGES = {'x': (-100, 500), 'y': (-100, 300)}
+
+# Fallback for color keys a theme leaves out (anything not listed falls back to white)
+_THEME_COLOR_DEFAULTS = {'shadow': "#000000", 'status': "#808080"}
+
 
 class SettingsWindow:
     """Lightweight settings window with tabbed interface and hybrid preview."""
@@ -23,8 +55,29 @@ class SettingsWindow:
         self.parent_widget = parent_widget
         self.config = parent_widget.config
 
-        # Track original settings for cancel/revert
-        self.original_config = self._deep_copy_config()
+        # Original settings for cancel/revert, snapshotted on the first edit
+        self.original_config = None
+
+        # Snapshot config sections once so tab construction reads plain dicts
+        self._cfg = self._snapshot_config()
+
+        # Scrollable canvases with a scroll region refresh already queued
+        self._scrollregion_pending = set()
+
+        # Pending debounced preview (Tk after id) and the settings it covers
+        self._preview_after_id = None
+        self._pending_changes = {}
+        self._pending_full_preview = False
+        self._preview_deferred = False  # Held back while the window is not viewable
+
+        # Settings last drawn by apply_instant_preview, to skip identical redraws
+        self._last_preview = None
+
+        # Nesting depth of _batched_updates blocks
+        self._batch_depth = 0
+
+        # Set while on_center_change shifts every line, so the status-line hint stays quiet
+        self._moving_center = False
 
         # Create window
         self.window = tk.Toplevel(parent_widget.root)
@@ -45,6 +98,9 @@ class SettingsWindow:
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_cancel)
 
+        # Run any preview held back while minimized once the window is shown again
+        self.window.bind("<Map>", self._on_window_mapped)
+
         # Show widget border when settings is open
         self.parent_widget.show_settings_border(True)
 
@@ -55,11 +111,15 @@ class SettingsWindow:
         self.notebook = ttk.Notebook(self.window)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Create tabs
-        self.create_location_tab()
-        self.create_appearance_tab()
-        self.create_spacing_tab()
-        self.create_display_tab()
+        # Create tabs: only the first is built now, the rest on first selection
+        self._tab_builders = {}
+        self._built_tabs = set()
+        first_tab = self._add_lazy_tab('location', "Location & Weather", self.create_location_tab)
+        self._add_lazy_tab('appearance', "Appearance", self.create_appearance_tab)
+        self._add_lazy_tab('spacing', "Spacing", self.create_spacing_tab)
+        self._add_lazy_tab('display', "Display", self.create_display_tab)
+        self._build_tab(first_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_selected)
 
         # Bottom button panel
         self.create_button_panel()
@@ -177,6 +237,9 @@ class SettingsWindow:
     def reload_all_settings(self):
         """Reload all settings from the currently selected instance."""
         try:
+            # Refresh the section snapshot for the newly selected instance
+            self._cfg = self._snapshot_config()
+
             # Reload location settings
             self.zip_entry.delete(0, tk.END)
             self.zip_entry.insert(0, self.config.get('location', 'zip_code'))
@@ -191,96 +254,109 @@ class SettingsWindow:
             # Reload weather display settings
             current_format = self.config.get('weather', 'display_format')
             if current_format in self.format_map_reverse:
-                self.weather_format_var.set(self.format_map_reverse[current_format])
+                self.weather_format_combo.set(self.format_map_reverse[current_format])
 
             self.show_weather_attribution_var.set(self.config.get('weather', 'show_attribution'))
             self.show_emoji_var.set(self.config.get('weather', 'show_emoji'))
             self.show_forecast_var.set(self.config.get('weather', 'show_forecast'))
 
-            # Reload font settings
-            self.font_family_var.set(self.config.get('fonts', 'family'))
-            self.time_size_var.set(self.config.get('fonts', 'time_size'))
-            self.date_size_var.set(self.config.get('fonts', 'date_size'))
-            self.weather_size_var.set(self.config.get('fonts', 'weather_size'))
-
-            # Reload color settings
-            self.text_color_var.set(self.config.get('colors', 'text'))
-            self.shadow_color_var.set(self.config.get('colors', 'shadow'))
-            self.status_color_var.set(self.config.get('colors', 'status'))
-            self.lock_colors_var.set(self.config.get('colors', 'lock_colors'))
-            self.time_color_var.set(self.config.get('colors', 'time_color'))
-            self.date_color_var.set(self.config.get('colors', 'date_color'))
-            self.weather_color_var.set(self.config.get('colors', 'weather_color'))
-
-            # Update color buttons
-            self.text_color_btn.config(bg=self.text_color_var.get())
-            self.shadow_color_btn.config(bg=self.shadow_color_var.get())
-            self.status_color_btn.config(bg=self.status_color_var.get())
-            self.time_color_btn.config(bg=self.time_color_var.get())
-            self.date_color_btn.config(bg=self.date_color_var.get())
-            self.weather_color_btn.config(bg=self.weather_color_var.get())
-
-            # Reload appearance settings
-            self.opacity_var.set(self.config.get('appearance', 'opacity'))
-            self.scale_var.set(self.config.get('appearance', 'scale'))
-            self.shadow_offset_x_var.set(self.config.get('appearance', 'shadow_offset_x'))
-            self.shadow_offset_y_var.set(self.config.get('appearance', 'shadow_offset_y'))
-
-            # Reload theme
-            current_theme = self.config.get('appearance', 'theme') or 'default'
-            if current_theme in THEMES:
-                self.theme_var.set(THEMES[current_theme]['name'])
-            else:
-                self.theme_var.set('Custom')
-
-            # Reload spacing settings
-            self.status_x_var.set(self.config.get('spacing', 'status_x'))
-            self.status_y_var.set(self.config.get('spacing', 'status_y'))
-            self.time_x_var.set(self.config.get('spacing', 'time_x'))
-            self.time_y_var.set(self.config.get('spacing', 'time_y'))
-            self.date_x_var.set(self.config.get('spacing', 'date_x'))
-            self.date_y_var.set(self.config.get('spacing', 'date_y'))
-            self.weather_x_var.set(self.config.get('spacing', 'weather_x'))
-            self.weather_y_var.set(self.config.get('spacing', 'weather_y'))
-            self.center_x_var.set(self.config.get('spacing', 'time_x'))
-            self.center_y_var.set(self.config.get('spacing', 'time_y'))
-
-            # Reload display settings
-            self.use_24h_var.set(self.config.get('display', 'use_24h_format'))
-            self.show_seconds_var.set(self.config.get('display', 'show_seconds'))
-            self.hourly_chime_var.set(self.config.get('display', 'hourly_chime'))
-            self.launch_at_boot_var.set(self.config.get('display', 'launch_at_boot'))
-            self.snap_to_edges_var.set(self.config.get('display', 'snap_to_edges'))
-
-            # Reload date format
-            current_date_format = self.config.get('display', 'date_format') or "%A, %B %d"
-            if current_date_format in self.date_format_map_reverse:
-                self.date_format_var.set(self.date_format_map_reverse[current_date_format])
-
-            # Toggle color lock visibility
-            self.toggle_color_lock()
-
-            # Update original config for cancel
-            self.original_config = self._deep_copy_config()
+            # Unbuilt tabs read the refreshed snapshot when first selected
+            if 'appearance' in self._built_tabs:
+                # Reload font settings
+                self.font_family_var.set(self.config.get('fonts', 'family'))
+                self.time_size_var.set(self.config.get('fonts', 'time_size'))
+                self.date_size_var.set(self.config.get('fonts', 'date_size'))
+                self.weather_size_var.set(self.config.get('fonts', 'weather_size'))
+
+                # Reload color settings and buttons
+                self.lock_colors_var.set(self.config.get('colors', 'lock_colors'))
+                for var, button, key in self._color_bindings:
+                    color = self.config.get('colors', key)
+                    var.set(color)
+                    self._set_button_color(button, color)
+
+                # Reload appearance settings
+                self.opacity_var.set(self.config.get('appearance', 'opacity'))
+                self.scale_var.set(self.config.get('appearance', 'scale'))
+                self.shadow_offset_x_var.set(self.config.get('appearance', 'shadow_offset_x'))
+                self.shadow_offset_y_var.set(self.config.get('appearance', 'shadow_offset_y'))
+
+                # Reload theme
+                current_theme = self.config.get('appearance', 'theme') or 'default'
+                if current_theme in THEMES:
+                    self.theme_var.set(THEMES[current_theme]['name'])
+                else:
+                    self.theme_var.set('Custom')
+
+                # Toggle color lock visibility
+                self.toggle_color_lock()
+
+            if 'spacing' in self._built_tabs:
+                # Reload spacing settings
+                self.status_x_var.set(self.config.get('spacing', 'status_x'))
+                self.status_y_var.set(self.config.get('spacing', 'status_y'))
+                self.time_x_var.set(self.config.get('spacing', 'time_x'))
+                self.time_y_var.set(self.config.get('spacing', 'time_y'))
+                self.date_x_var.set(self.config.get('spacing', 'date_x'))
+                self.date_y_var.set(self.config.get('spacing', 'date_y'))
+                self.weather_x_var.set(self.config.get('spacing', 'weather_x'))
+                self.weather_y_var.set(self.config.get('spacing', 'weather_y'))
+                self.center_x_var.set(self.config.get('spacing', 'time_x'))
+                self.center_y_var.set(self.config.get('spacing', 'time_y'))
+
+            if 'display' in self._built_tabs:
+                # Reload display settings
+                self.use_24h_var.set(self.config.get('display', 'use_24h_format'))
+                self.show_seconds_var.set(self.config.get('display', 'show_seconds'))
+                self.hourly_chime_var.set(self.config.get('display', 'hourly_chime'))
+                self.launch_at_boot_var.set(self.config.get('display', 'launch_at_boot'))
+                self.snap_to_edges_var.set(self.config.get('display', 'snap_to_edges'))
+
+                # Reload date format
+                current_date_format = self.config.get('display', 'date_format') or "%A, %B %d"
+                date_format_name = self.date_format_map_reverse.get(current_date_format)
+                if date_format_name is not None:
+                    self.date_format_var.set(date_format_name)
+
+            # Re-snapshot original config for cancel on the next edit
+            self.original_config = None
+            self._last_preview = None
 
         except Exception:
             pass  # Silent failure
 
-    def create_location_tab(self):
-        """Location settings: ZIP code, country, weather update interval."""
+    def _add_lazy_tab(self, name, text, builder):
+        """Add an empty tab frame whose contents are built by builder on first selection."""
         tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Location & Weather")
+        self.notebook.add(tab, text=text)
+        self._tab_builders[str(tab)] = (name, tab, builder)
+        return tab
+
+    def _build_tab(self, tab):
+        """Build a lazily-added tab's contents if they have not been built yet."""
+        entry = self._tab_builders.pop(str(tab), None)
+        if entry is not None:
+            name, tab, builder = entry
+            builder(tab)
+            self._built_tabs.add(name)
+
+    def _on_tab_selected(self, event=None):
+        """Build the selected tab on first visit."""
+        self._build_tab(self.notebook.select())
+
+    def create_location_tab(self, tab):
+        """Location settings: ZIP code, country, weather update interval."""
 
         # ZIP Code
         ttk.Label(tab, text="ZIP Code:", font=("Segoe UI", 10)).grid(row=0, column=0, sticky="w", padx=10, pady=10)
         self.zip_entry = ttk.Entry(tab, width=20)
-        self.zip_entry.insert(0, self.config.get('location', 'zip_code'))
+        self.zip_entry.insert(0, self._cfg['location']['zip_code'])
         self.zip_entry.grid(row=0, column=1, sticky="w", padx=10, pady=10)
 
         # Country
         ttk.Label(tab, text="Country:", font=("Segoe UI", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=10)
         self.country_entry = ttk.Entry(tab, width=20)
-        self.country_entry.insert(0, self.config.get('location', 'country'))
+        self.country_entry.insert(0, self._cfg['location']['country'])
         self.country_entry.grid(row=1, column=1, sticky="w", padx=10, pady=10)
 
         # Weather Update Interval
@@ -289,7 +365,7 @@ class SettingsWindow:
         interval_frame = ttk.Frame(tab)
         interval_frame.grid(row=2, column=1, sticky="w", padx=10, pady=10)
 
-        current_interval = self.config.get('updates', 'weather_interval') // 60000  # Convert ms to minutes
+        current_interval = self._cfg['updates']['weather_interval'] // 60000  # Convert ms to minutes
         self.weather_interval_var = tk.IntVar(value=current_interval)
 
         # Entry field for direct input
@@ -323,30 +399,29 @@ class SettingsWindow:
             ("Minimal (Temp only)", "minimal")
         ]
 
-        self.weather_format_var = tk.StringVar(value=self.config.get('weather', 'display_format'))
-        format_combo = ttk.Combobox(tab, textvariable=self.weather_format_var,
-                                    values=[fmt[0] for fmt in weather_formats],
-                                    state="readonly", width=30)
-        format_combo.grid(row=5, column=1, sticky="w", padx=10, pady=10)
+        # Only read on Apply, so the combobox is queried directly (no Tk variable)
+        self.weather_format_combo = ttk.Combobox(tab, values=[fmt[0] for fmt in weather_formats],
+                                                 state="readonly", width=30)
+        self.weather_format_combo.grid(row=5, column=1, sticky="w", padx=10, pady=10)
 
         # Map display names to format keys
         self.format_map = {fmt[0]: fmt[1] for fmt in weather_formats}
         self.format_map_reverse = {fmt[1]: fmt[0] for fmt in weather_formats}
 
         # Set initial value
-        current_format = self.config.get('weather', 'display_format')
+        current_format = self._cfg['weather']['display_format']
         if current_format in self.format_map_reverse:
-            format_combo.set(self.format_map_reverse[current_format])
+            self.weather_format_combo.set(self.format_map_reverse[current_format])
 
         # Show Weather Attribution
-        self.show_weather_attribution_var = tk.BooleanVar(value=self.config.get('weather', 'show_attribution'))
+        self.show_weather_attribution_var = tk.BooleanVar(value=self._cfg['weather']['show_attribution'])
         ttk.Checkbutton(tab, text='Show "Weather from wttr.in" attribution',
                        variable=self.show_weather_attribution_var).grid(
             row=6, column=0, columnspan=2, sticky="w", padx=10, pady=5
         )
 
         # Show Weather Emoji
-        self.show_emoji_var = tk.BooleanVar(value=self.config.get('weather', 'show_emoji'))
+        self.show_emoji_var = tk.BooleanVar(value=self._cfg['weather']['show_emoji'])
         emoji_check = ttk.Checkbutton(tab, text='Show weather emoji icons',
                        variable=self.show_emoji_var)
         emoji_check.grid(row=7, column=0, columnspan=2, sticky="w", padx=10, pady=5)
@@ -360,7 +435,7 @@ class SettingsWindow:
             row=9, column=0, sticky="w", padx=10, pady=(5, 5)
         )
 
-        self.show_forecast_var = tk.BooleanVar(value=self.config.get('weather', 'show_forecast'))
+        self.show_forecast_var = tk.BooleanVar(value=self._cfg['weather']['show_forecast'])
         forecast_check = ttk.Checkbutton(tab, text="Show tomorrow's forecast",
                        variable=self.show_forecast_var)
         forecast_check.grid(row=10, column=0, columnspan=2, sticky="w", padx=10, pady=5)
@@ -372,21 +447,14 @@ class SettingsWindow:
             row=11, column=0, columnspan=2, sticky="w", padx=10, pady=20
         )
 
-    def create_appearance_tab(self):
+    def create_appearance_tab(self, tab):
         """Appearance settings: fonts, colors, opacity (instant preview)."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Appearance")
 
-        # Create canvas for scrolling
+        # Create canvas for scrolling (scroll region is set once all rows exist)
         canvas = tk.Canvas(tab, highlightthickness=0)
         scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
@@ -402,7 +470,7 @@ class SettingsWindow:
         row += 1
 
         theme_names = ["Custom"] + [t["name"] for t in THEMES.values()]
-        current_theme = self.config.get('appearance', 'theme') or 'default'
+        current_theme = self._cfg['appearance']['theme'] or 'default'
         current_theme_name = THEMES.get(current_theme, {}).get('name', 'Custom')
 
         self.theme_var = tk.StringVar(value=current_theme_name)
@@ -468,7 +536,7 @@ class SettingsWindow:
             "Verdana",
             "Yu Gothic", "Yu Gothic Light", "Yu Gothic Medium", "Yu Gothic UI", "Yu Gothic UI Light", "Yu Gothic UI Semibold", "Yu Gothic UI Semilight"
         ]
-        self.font_family_var = tk.StringVar(value=self.config.get('fonts', 'family'))
+        self.font_family_var = tk.StringVar(value=self._cfg['fonts']['family'])
         font_combo = ttk.Combobox(scrollable_frame, textvariable=self.font_family_var, values=font_families, state="readonly", width=25)
         font_combo.grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=5)
         font_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_instant_preview())
@@ -484,11 +552,10 @@ class SettingsWindow:
         size_frame = ttk.Frame(scrollable_frame)
         size_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         ttk.Label(size_frame, text="Time Size:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.time_size_var = tk.IntVar(value=self.config.get('fonts', 'time_size'))
+        self.time_size_var = tk.IntVar(value=self._cfg['fonts']['time_size'])
         self.time_size_entry = ttk.Entry(size_frame, width=6, textvariable=self.time_size_var)
         self.time_size_entry.pack(side=tk.LEFT, padx=(0, 10))
-        time_slider = ttk.Scale(size_frame, from_=24, to=72, orient=tk.HORIZONTAL, variable=self.time_size_var,
-                                command=lambda v: self.apply_instant_preview())
+        time_slider = self._make_int_scale(size_frame, self.time_size_var, 24, 72)
         time_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         row += 1
 
@@ -496,11 +563,10 @@ class SettingsWindow:
         size_frame = ttk.Frame(scrollable_frame)
         size_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         ttk.Label(size_frame, text="Date Size:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.date_size_var = tk.IntVar(value=self.config.get('fonts', 'date_size'))
+        self.date_size_var = tk.IntVar(value=self._cfg['fonts']['date_size'])
         self.date_size_entry = ttk.Entry(size_frame, width=6, textvariable=self.date_size_var)
         self.date_size_entry.pack(side=tk.LEFT, padx=(0, 10))
-        date_slider = ttk.Scale(size_frame, from_=10, to=32, orient=tk.HORIZONTAL, variable=self.date_size_var,
-                                command=lambda v: self.apply_instant_preview())
+        date_slider = self._make_int_scale(size_frame, self.date_size_var, 10, 32)
         date_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         row += 1
 
@@ -508,11 +574,10 @@ class SettingsWindow:
         size_frame = ttk.Frame(scrollable_frame)
         size_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         ttk.Label(size_frame, text="Weather Size:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.weather_size_var = tk.IntVar(value=self.config.get('fonts', 'weather_size'))
+        self.weather_size_var = tk.IntVar(value=self._cfg['fonts']['weather_size'])
         self.weather_size_entry = ttk.Entry(size_frame, width=6, textvariable=self.weather_size_var)
         self.weather_size_entry.pack(side=tk.LEFT, padx=(0, 10))
-        weather_slider = ttk.Scale(size_frame, from_=10, to=32, orient=tk.HORIZONTAL, variable=self.weather_size_var,
-                                   command=lambda v: self.apply_instant_preview())
+        weather_slider = self._make_int_scale(size_frame, self.weather_size_var, 10, 32)
         weather_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         row += 1
 
@@ -523,23 +588,18 @@ class SettingsWindow:
         row += 1
 
         # Lock Colors Checkbox
-        self.lock_colors_var = tk.BooleanVar(value=self.config.get('colors', 'lock_colors'))
+        self.lock_colors_var = tk.BooleanVar(value=self._cfg['colors']['lock_colors'])
         ttk.Checkbutton(scrollable_frame, text="Lock all text colors together", variable=self.lock_colors_var,
                        command=self.toggle_color_lock).grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=5)
         row += 1
 
         # Text Color (Master when locked)
-        color_frame = ttk.Frame(scrollable_frame)
-        color_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(color_frame, text="Text Color:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.text_color_var = tk.StringVar(value=self.config.get('colors', 'text'))
-        self.text_color_entry = ttk.Entry(color_frame, textvariable=self.text_color_var, width=10)
-        self.text_color_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.text_color_entry.bind("<Return>", lambda e: self.on_hex_color_change('text', self.text_color_var, self.text_color_btn))
-        self.text_color_entry.bind("<FocusOut>", lambda e: self.on_hex_color_change('text', self.text_color_var, self.text_color_btn))
-        self.text_color_btn = tk.Button(color_frame, bg=self.text_color_var.get(), width=3, text="...",
-                                        command=lambda: self.choose_color('text', self.text_color_var, self.text_color_btn))
-        self.text_color_btn.pack(side=tk.LEFT, padx=5)
+        self._color_widgets = {}
+        self._color_bindings = []
+        self._button_colors = {}
+        self.text_color_var, self.text_color_entry, self.text_color_btn = self._make_color_row(
+            scrollable_frame, 'text', 'text', "Text Color:", row=row
+        )
         row += 1
 
         # Individual Line Colors (shown when unlocked)
@@ -547,44 +607,16 @@ class SettingsWindow:
         self.individual_colors_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         row += 1
 
-        # Time Color
-        time_color_frame = ttk.Frame(self.individual_colors_frame)
-        time_color_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(time_color_frame, text="  Time:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.time_color_var = tk.StringVar(value=self.config.get('colors', 'time_color'))
-        self.time_color_entry = ttk.Entry(time_color_frame, textvariable=self.time_color_var, width=10)
-        self.time_color_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.time_color_entry.bind("<Return>", lambda e: self.on_hex_color_change('time', self.time_color_var, self.time_color_btn))
-        self.time_color_entry.bind("<FocusOut>", lambda e: self.on_hex_color_change('time', self.time_color_var, self.time_color_btn))
-        self.time_color_btn = tk.Button(time_color_frame, bg=self.time_color_var.get(), width=3, text="...",
-                                        command=lambda: self.choose_color('time', self.time_color_var, self.time_color_btn))
-        self.time_color_btn.pack(side=tk.LEFT, padx=5)
-
-        # Date Color
-        date_color_frame = ttk.Frame(self.individual_colors_frame)
-        date_color_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(date_color_frame, text="  Date:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.date_color_var = tk.StringVar(value=self.config.get('colors', 'date_color'))
-        self.date_color_entry = ttk.Entry(date_color_frame, textvariable=self.date_color_var, width=10)
-        self.date_color_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.date_color_entry.bind("<Return>", lambda e: self.on_hex_color_change('date', self.date_color_var, self.date_color_btn))
-        self.date_color_entry.bind("<FocusOut>", lambda e: self.on_hex_color_change('date', self.date_color_var, self.date_color_btn))
-        self.date_color_btn = tk.Button(date_color_frame, bg=self.date_color_var.get(), width=3, text="...",
-                                        command=lambda: self.choose_color('date', self.date_color_var, self.date_color_btn))
-        self.date_color_btn.pack(side=tk.LEFT, padx=5)
-
-        # Weather Color
-        weather_color_frame = ttk.Frame(self.individual_colors_frame)
-        weather_color_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(weather_color_frame, text="  Weather:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.weather_color_var = tk.StringVar(value=self.config.get('colors', 'weather_color'))
-        self.weather_color_entry = ttk.Entry(weather_color_frame, textvariable=self.weather_color_var, width=10)
-        self.weather_color_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.weather_color_entry.bind("<Return>", lambda e: self.on_hex_color_change('weather', self.weather_color_var, self.weather_color_btn))
-        self.weather_color_entry.bind("<FocusOut>", lambda e: self.on_hex_color_change('weather', self.weather_color_var, self.weather_color_btn))
-        self.weather_color_btn = tk.Button(weather_color_frame, bg=self.weather_color_var.get(), width=3, text="...",
-                                           command=lambda: self.choose_color('weather', self.weather_color_var, self.weather_color_btn))
-        self.weather_color_btn.pack(side=tk.LEFT, padx=5)
+        # Time, Date and Weather Colors
+        self.time_color_var, self.time_color_entry, self.time_color_btn = self._make_color_row(
+            self.individual_colors_frame, 'time', 'time_color', "  Time:"
+        )
+        self.date_color_var, self.date_color_entry, self.date_color_btn = self._make_color_row(
+            self.individual_colors_frame, 'date', 'date_color', "  Date:"
+        )
+        self.weather_color_var, self.weather_color_entry, self.weather_color_btn = self._make_color_row(
+            self.individual_colors_frame, 'weather', 'weather_color', "  Weather:"
+        )
 
         # Set initial visibility based on lock state
         if self.lock_colors_var.get():
@@ -592,31 +624,15 @@ class SettingsWindow:
         row += 1
 
         # Shadow Color
-        color_frame = ttk.Frame(scrollable_frame)
-        color_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(color_frame, text="Shadow Color:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.shadow_color_var = tk.StringVar(value=self.config.get('colors', 'shadow'))
-        self.shadow_color_entry = ttk.Entry(color_frame, textvariable=self.shadow_color_var, width=10)
-        self.shadow_color_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.shadow_color_entry.bind("<Return>", lambda e: self.on_hex_color_change('shadow', self.shadow_color_var, self.shadow_color_btn))
-        self.shadow_color_entry.bind("<FocusOut>", lambda e: self.on_hex_color_change('shadow', self.shadow_color_var, self.shadow_color_btn))
-        self.shadow_color_btn = tk.Button(color_frame, bg=self.shadow_color_var.get(), width=3, text="...",
-                                         command=lambda: self.choose_color('shadow', self.shadow_color_var, self.shadow_color_btn))
-        self.shadow_color_btn.pack(side=tk.LEFT, padx=5)
+        self.shadow_color_var, self.shadow_color_entry, self.shadow_color_btn = self._make_color_row(
+            scrollable_frame, 'shadow', 'shadow', "Shadow Color:", row=row
+        )
         row += 1
 
         # Status Color
-        color_frame = ttk.Frame(scrollable_frame)
-        color_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(color_frame, text="Status Color:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.status_color_var = tk.StringVar(value=self.config.get('colors', 'status'))
-        self.status_color_entry = ttk.Entry(color_frame, textvariable=self.status_color_var, width=10)
-        self.status_color_entry.pack(side=tk.LEFT, padx=(0, 5))
-        self.status_color_entry.bind("<Return>", lambda e: self.on_hex_color_change('status', self.status_color_var, self.status_color_btn))
-        self.status_color_entry.bind("<FocusOut>", lambda e: self.on_hex_color_change('status', self.status_color_var, self.status_color_btn))
-        self.status_color_btn = tk.Button(color_frame, bg=self.status_color_var.get(), width=3, text="...",
-                                         command=lambda: self.choose_color('status', self.status_color_var, self.status_color_btn))
-        self.status_color_btn.pack(side=tk.LEFT, padx=5)
+        self.status_color_var, self.status_color_entry, self.status_color_btn = self._make_color_row(
+            scrollable_frame, 'status', 'status', "Status Color:", row=row
+        )
         row += 1
 
         # Opacity
@@ -628,12 +644,11 @@ class SettingsWindow:
         opacity_frame = ttk.Frame(scrollable_frame)
         opacity_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
 
-        self.opacity_var = tk.DoubleVar(value=self.config.get('appearance', 'opacity'))
+        self.opacity_var = tk.DoubleVar(value=self._cfg['appearance']['opacity'])
         self.opacity_entry = ttk.Entry(opacity_frame, textvariable=self.opacity_var, width=8)
         self.opacity_entry.pack(side=tk.LEFT, padx=(0, 10))
 
-        opacity_slider = ttk.Scale(opacity_frame, from_=0.3, to=1.0, orient=tk.HORIZONTAL, variable=self.opacity_var,
-                                   command=lambda v: self.apply_instant_preview())
+        opacity_slider = ttk.Scale(opacity_frame, from_=0.3, to=1.0, orient=tk.HORIZONTAL, variable=self.opacity_var)
         opacity_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         row += 1
 
@@ -646,12 +661,11 @@ class SettingsWindow:
         scale_frame = ttk.Frame(scrollable_frame)
         scale_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
 
-        self.scale_var = tk.DoubleVar(value=self.config.get('appearance', 'scale'))
+        self.scale_var = tk.DoubleVar(value=self._cfg['appearance']['scale'])
         self.scale_entry = ttk.Entry(scale_frame, textvariable=self.scale_var, width=8)
         self.scale_entry.pack(side=tk.LEFT, padx=(0, 10))
 
-        scale_slider = ttk.Scale(scale_frame, from_=0.5, to=3.0, orient=tk.HORIZONTAL, variable=self.scale_var,
-                                command=lambda v: self.apply_instant_preview())
+        scale_slider = ttk.Scale(scale_frame, from_=0.5, to=3.0, orient=tk.HORIZONTAL, variable=self.scale_var)
         scale_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         ToolTip(scale_slider, "Overall widget size multiplier (0.5 = half size, 2.0 = double size)")
         row += 1
@@ -666,12 +680,10 @@ class SettingsWindow:
         shadow_x_frame = ttk.Frame(scrollable_frame)
         shadow_x_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         ttk.Label(shadow_x_frame, text="Shadow X:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.shadow_offset_x_var = tk.IntVar(value=self.config.get('appearance', 'shadow_offset_x'))
+        self.shadow_offset_x_var = tk.IntVar(value=self._cfg['appearance']['shadow_offset_x'])
         shadow_x_entry = ttk.Entry(shadow_x_frame, textvariable=self.shadow_offset_x_var, width=6)
         shadow_x_entry.pack(side=tk.LEFT, padx=(0, 10))
-        shadow_x_slider = ttk.Scale(shadow_x_frame, from_=0, to=10, orient=tk.HORIZONTAL,
-                                    variable=self.shadow_offset_x_var,
-                                    command=lambda v: self.apply_instant_preview())
+        shadow_x_slider = self._make_int_scale(shadow_x_frame, self.shadow_offset_x_var, 0, 10)
         shadow_x_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         ToolTip(shadow_x_slider, "Horizontal shadow offset (pixels)")
         row += 1
@@ -680,12 +692,10 @@ class SettingsWindow:
         shadow_y_frame = ttk.Frame(scrollable_frame)
         shadow_y_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         ttk.Label(shadow_y_frame, text="Shadow Y:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.shadow_offset_y_var = tk.IntVar(value=self.config.get('appearance', 'shadow_offset_y'))
+        self.shadow_offset_y_var = tk.IntVar(value=self._cfg['appearance']['shadow_offset_y'])
         shadow_y_entry = ttk.Entry(shadow_y_frame, textvariable=self.shadow_offset_y_var, width=6)
         shadow_y_entry.pack(side=tk.LEFT, padx=(0, 10))
-        shadow_y_slider = ttk.Scale(shadow_y_frame, from_=0, to=10, orient=tk.HORIZONTAL,
-                                    variable=self.shadow_offset_y_var,
-                                    command=lambda v: self.apply_instant_preview())
+        shadow_y_slider = self._make_int_scale(shadow_y_frame, self.shadow_offset_y_var, 0, 10)
         shadow_y_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         ToolTip(shadow_y_slider, "Vertical shadow offset (pixels)")
         row += 1
@@ -696,21 +706,107 @@ class SettingsWindow:
             row=row, column=0, columnspan=2, sticky="w", padx=10, pady=20
         )
 
-    def create_spacing_tab(self):
+        # Preview on any write to a slider variable (drag, typed entry, or programmatic set)
+        self._vars = {
+            'time_size': self.time_size_var,
+            'date_size': self.date_size_var,
+            'weather_size': self.weather_size_var,
+            'opacity': self.opacity_var,
+            'scale': self.scale_var,
+            'shadow_offset_x': self.shadow_offset_x_var,
+            'shadow_offset_y': self.shadow_offset_y_var,
+        }
+        for var in self._vars.values():
+            var.trace_add('write', self._on_any_var_changed)
+
+        self._finish_scrollable_frame(canvas, scrollable_frame)
+
+    def _finish_scrollable_frame(self, canvas, scrollable_frame):
+        """Compute the scroll region once, then track later resizes with idle-coalesced updates."""
+        scrollable_frame.update_idletasks()
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        scrollable_frame.bind("<Configure>", partial(self._schedule_scrollregion, canvas))
+
+    def _schedule_scrollregion(self, canvas, event=None):
+        """Queue a single scroll region refresh for canvas on the next idle slot."""
+        if canvas not in self._scrollregion_pending:
+            self._scrollregion_pending.add(canvas)
+            canvas.after_idle(self._update_scrollregion, canvas)
+
+    def _update_scrollregion(self, canvas):
+        """Refresh canvas scroll region to fit its contents."""
+        self._scrollregion_pending.discard(canvas)
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def _make_int_scale(self, parent, var, low, high):
+        """
+        Create a horizontal slider that snaps to whole numbers.
+
+        The slider is not bound to var directly; var is only written when the
+        rounded value changes, so sub-pixel drags do not re-fire its traces.
+        """
+        slider = ttk.Scale(parent, from_=low, to=high, orient=tk.HORIZONTAL, value=var.get(),
+                           command=partial(self._int_scale_cmd, var))
+        var.trace_add('write', partial(self._sync_int_scale, slider, var))
+        return slider
+
+    def _int_scale_cmd(self, var, value):
+        """Slider command: round to an integer and write var only if it changed."""
+        snapped = int(round(float(value)))
+        try:
+            if var.get() == snapped:
+                return
+        except tk.TclError:
+            pass  # Entry holds a partial number - overwrite it
+        var.set(snapped)
+
+    def _sync_int_scale(self, slider, var, *args):
+        """Keep an integer slider on its variable after typed or programmatic changes."""
+        try:
+            value = var.get()
+        except tk.TclError:
+            return
+        if int(round(slider.get())) != value:
+            slider.set(value)
+
+    def _make_color_row(self, parent, color_type, config_key, label, row=None):
+        """
+        Build one hex-entry + picker-button color row.
+
+        Rows with a grid row are gridded into parent, others are packed.
+        Returns (var, entry, button) and registers them in self._color_widgets
+        and, with the config key, in self._color_bindings.
+        """
+        color_frame = ttk.Frame(parent)
+        if row is None:
+            color_frame.pack(fill=tk.X, pady=2)
+        else:
+            color_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
+        ttk.Label(color_frame, text=label, font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
+
+        value = self._cfg['colors'][config_key]
+        var = tk.StringVar(value=value)
+        entry = ttk.Entry(color_frame, textvariable=var, width=10)
+        entry.pack(side=tk.LEFT, padx=(0, 5))
+        entry.bind("<Return>", lambda e, k=color_type: self.on_hex_color_change(k))
+        entry.bind("<FocusOut>", lambda e, k=color_type: self.on_hex_color_change(k))
+        button = tk.Button(color_frame, bg=value, width=3, text="...",
+                           command=lambda k=color_type: self.choose_color(k))
+        button.pack(side=tk.LEFT, padx=5)
+
+        self._color_widgets[color_type] = (var, entry, button)
+        self._color_bindings.append((var, button, config_key))
+        self._button_colors[button] = value
+        return var, entry, button
+
+    def create_spacing_tab(self, tab):
         """Spacing settings: X and Y positions of each line (instant preview)."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Spacing")
 
-        # Create canvas for scrolling
+        # Create canvas for scrolling (scroll region is set once all rows exist)
         canvas = tk.Canvas(tab, highlightthickness=0)
         scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
@@ -731,8 +827,8 @@ class SettingsWindow:
         row += 1
 
         # Calculate initial center (use time position as reference)
-        self.center_x_var = tk.IntVar(value=self.config.get('spacing', 'time_x'))
-        self.center_y_var = tk.IntVar(value=self.config.get('spacing', 'time_y'))
+        self.center_x_var = tk.IntVar(value=self._cfg['spacing']['time_x'])
+        self.center_y_var = tk.IntVar(value=self._cfg['spacing']['time_y'])
 
         # Center X
         center_x_frame = ttk.Frame(scrollable_frame)
@@ -740,8 +836,8 @@ class SettingsWindow:
         ttk.Label(center_x_frame, text="Center X:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
         self.center_x_entry = ttk.Entry(center_x_frame, textvariable=self.center_x_var, width=8)
         self.center_x_entry.pack(side=tk.LEFT, padx=(0, 10))
-        center_x_slider = ttk.Scale(center_x_frame, from_=-100, to=500, orient=tk.HORIZONTAL, variable=self.center_x_var,
-                                    command=lambda v: self.on_center_change())
+        center_x_slider = ttk.Scale(center_x_frame, from_=_SPACING_RANGES['x'][0], to=_SPACING_RANGES['x'][1], orient=tk.HORIZONTAL, variable=self.center_x_var,
+                                    command=self.on_center_change)
         center_x_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         row += 1
 
@@ -751,8 +847,8 @@ class SettingsWindow:
         ttk.Label(center_y_frame, text="Center Y:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
         self.center_y_entry = ttk.Entry(center_y_frame, textvariable=self.center_y_var, width=8)
         self.center_y_entry.pack(side=tk.LEFT, padx=(0, 10))
-        center_y_slider = ttk.Scale(center_y_frame, from_=-100, to=300, orient=tk.HORIZONTAL, variable=self.center_y_var,
-                                    command=lambda v: self.on_center_change())
+        center_y_slider = ttk.Scale(center_y_frame, from_=_SPACING_RANGES['y'][0], to=_SPACING_RANGES['y'][1], orient=tk.HORIZONTAL, variable=self.center_y_var,
+                                    command=self.on_center_change)
         center_y_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         row += 1
 
@@ -771,101 +867,31 @@ class SettingsWindow:
         )
         row += 1
 
-        # Status Line X Position
-        status_x_frame = ttk.Frame(scrollable_frame)
-        status_x_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(status_x_frame, text="Status X:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.status_x_var = tk.IntVar(value=self.config.get('spacing', 'status_x'))
-        self.status_x_entry = ttk.Entry(status_x_frame, textvariable=self.status_x_var, width=8)
-        self.status_x_entry.pack(side=tk.LEFT, padx=(0, 10))
-        status_x_slider = ttk.Scale(status_x_frame, from_=-100, to=500, orient=tk.HORIZONTAL, variable=self.status_x_var,
-                                    command=lambda v: self.on_spacing_change('status_x', v))
-        status_x_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Status Line Y Position
-        status_y_frame = ttk.Frame(scrollable_frame)
-        status_y_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(status_y_frame, text="Status Y:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.status_y_var = tk.IntVar(value=self.config.get('spacing', 'status_y'))
-        self.status_y_entry = ttk.Entry(status_y_frame, textvariable=self.status_y_var, width=8)
-        self.status_y_entry.pack(side=tk.LEFT, padx=(0, 10))
-        status_y_slider = ttk.Scale(status_y_frame, from_=-100, to=300, orient=tk.HORIZONTAL, variable=self.status_y_var,
-                                    command=lambda v: self.on_spacing_change('status_y', v))
-        status_y_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Time Line X Position
-        time_x_frame = ttk.Frame(scrollable_frame)
-        time_x_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(time_x_frame, text="Time X:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.time_x_var = tk.IntVar(value=self.config.get('spacing', 'time_x'))
-        self.time_x_entry = ttk.Entry(time_x_frame, textvariable=self.time_x_var, width=8)
-        self.time_x_entry.pack(side=tk.LEFT, padx=(0, 10))
-        time_x_slider = ttk.Scale(time_x_frame, from_=-100, to=500, orient=tk.HORIZONTAL, variable=self.time_x_var,
-                                  command=lambda v: self.on_spacing_change('time_x', v))
-        time_x_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Time Line Y Position
-        time_y_frame = ttk.Frame(scrollable_frame)
-        time_y_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(time_y_frame, text="Time Y:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.time_y_var = tk.IntVar(value=self.config.get('spacing', 'time_y'))
-        self.time_y_entry = ttk.Entry(time_y_frame, textvariable=self.time_y_var, width=8)
-        self.time_y_entry.pack(side=tk.LEFT, padx=(0, 10))
-        time_y_slider = ttk.Scale(time_y_frame, from_=-100, to=300, orient=tk.HORIZONTAL, variable=self.time_y_var,
-                                  command=lambda v: self.on_spacing_change('time_y', v))
-        time_y_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Date Line X Position
-        date_x_frame = ttk.Frame(scrollable_frame)
-        date_x_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(date_x_frame, text="Date X:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.date_x_var = tk.IntVar(value=self.config.get('spacing', 'date_x'))
-        self.date_x_entry = ttk.Entry(date_x_frame, textvariable=self.date_x_var, width=8)
-        self.date_x_entry.pack(side=tk.LEFT, padx=(0, 10))
-        date_x_slider = ttk.Scale(date_x_frame, from_=-100, to=500, orient=tk.HORIZONTAL, variable=self.date_x_var,
-                                  command=lambda v: self.on_spacing_change('date_x', v))
-        date_x_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Date Line Y Position
-        date_y_frame = ttk.Frame(scrollable_frame)
-        date_y_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(date_y_frame, text="Date Y:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.date_y_var = tk.IntVar(value=self.config.get('spacing', 'date_y'))
-        self.date_y_entry = ttk.Entry(date_y_frame, textvariable=self.date_y_var, width=8)
-        self.date_y_entry.pack(side=tk.LEFT, padx=(0, 10))
-        date_y_slider = ttk.Scale(date_y_frame, from_=-100, to=300, orient=tk.HORIZONTAL, variable=self.date_y_var,
-                                  command=lambda v: self.on_spacing_change('date_y', v))
-        date_y_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Weather Line X Position
-        weather_x_frame = ttk.Frame(scrollable_frame)
-        weather_x_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(weather_x_frame, text="Weather X:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.weather_x_var = tk.IntVar(value=self.config.get('spacing', 'weather_x'))
-        self.weather_x_entry = ttk.Entry(weather_x_frame, textvariable=self.weather_x_var, width=8)
-        self.weather_x_entry.pack(side=tk.LEFT, padx=(0, 10))
-        weather_x_slider = ttk.Scale(weather_x_frame, from_=-100, to=500, orient=tk.HORIZONTAL, variable=self.weather_x_var,
-                                     command=lambda v: self.on_spacing_change('weather_x', v))
-        weather_x_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
-
-        # Weather Line Y Position
-        weather_y_frame = ttk.Frame(scrollable_frame)
-        weather_y_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        ttk.Label(weather_y_frame, text="Weather Y:", font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
-        self.weather_y_var = tk.IntVar(value=self.config.get('spacing', 'weather_y'))
-        self.weather_y_entry = ttk.Entry(weather_y_frame, textvariable=self.weather_y_var, width=8)
-        self.weather_y_entry.pack(side=tk.LEFT, padx=(0, 10))
-        weather_y_slider = ttk.Scale(weather_y_frame, from_=-100, to=300, orient=tk.HORIZONTAL, variable=self.weather_y_var,
-                                     command=lambda v: self.on_spacing_change('weather_y', v))
-        weather_y_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        row += 1
+        # Per-line variables exist right away so preview/apply can read them;
+        # their row widgets are filled in on the next idle tick
+        self._spacing_vars = {}
+        for key, _ in _SPACING_ROWS:
+            var = tk.IntVar(value=self._cfg['spacing'][key])
+            var.trace_add('write', partial(self._on_spacing_var_changed, key))
+            self._spacing_vars[key] = var
+            setattr(self, f"{key}_var", var)
+
+        self.window.after_idle(self._spacing_rows_stage2, canvas, scrollable_frame, row)
+
+    def _spacing_rows_stage2(self, canvas, scrollable_frame, row):
+        """Build the per-line X/Y rows of the spacing tab (slider range picked by axis)."""
+        for key, label in _SPACING_ROWS:
+            low, high = _SPACING_RANGES[key[-1]]
+            var = self._spacing_vars[key]
+            line_frame = ttk.Frame(scrollable_frame)
+            line_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
+            ttk.Label(line_frame, text=label, font=("Segoe UI", 9), width=12).pack(side=tk.LEFT)
+            entry = ttk.Entry(line_frame, textvariable=var, width=8)
+            entry.pack(side=tk.LEFT, padx=(0, 10))
+            slider = self._make_int_scale(line_frame, var, low, high)
+            slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            setattr(self, f"{key}_entry", entry)
+            row += 1
 
         # Info label
         info_text = "Changes preview instantly on the widget."
@@ -873,21 +899,21 @@ class SettingsWindow:
             row=row, column=0, columnspan=2, sticky="w", padx=10, pady=20
         )
 
-    def create_display_tab(self):
+        self._finish_scrollable_frame(canvas, scrollable_frame)
+
+    def create_display_tab(self, tab):
         """Display settings: time format, show seconds, position (instant preview for format)."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Display")
 
         # Time Format Options
         ttk.Label(tab, text="Time Format:", font=("Segoe UI", 10, "bold")).grid(
             row=0, column=0, sticky="w", padx=10, pady=(10, 5)
         )
 
-        self.use_24h_var = tk.BooleanVar(value=self.config.get('display', 'use_24h_format'))
+        self.use_24h_var = tk.BooleanVar(value=self._cfg['display']['use_24h_format'])
         ttk.Checkbutton(tab, text="Use 24-Hour Format", variable=self.use_24h_var,
                        command=self.apply_instant_preview).grid(row=1, column=0, sticky="w", padx=10, pady=5)
 
-        self.show_seconds_var = tk.BooleanVar(value=self.config.get('display', 'show_seconds'))
+        self.show_seconds_var = tk.BooleanVar(value=self._cfg['display']['show_seconds'])
         ttk.Checkbutton(tab, text="Show Seconds", variable=self.show_seconds_var,
                        command=self.apply_instant_preview).grid(row=2, column=0, sticky="w", padx=10, pady=5)
 
@@ -896,24 +922,15 @@ class SettingsWindow:
             row=3, column=0, sticky="w", padx=10, pady=(20, 5)
         )
 
-        date_formats = [
-            ("Full (Saturday, January 11)", "%A, %B %d"),
-            ("Short (Sat, Jan 11)", "%a, %b %d"),
-            ("Numeric (01/11/2025)", "%m/%d/%Y"),
-            ("ISO (2025-01-11)", "%Y-%m-%d"),
-            ("European (11 January 2025)", "%d %B %Y"),
-            ("Minimal (Jan 11)", "%b %d")
-        ]
-
-        self.date_format_map = {fmt[0]: fmt[1] for fmt in date_formats}
-        self.date_format_map_reverse = {fmt[1]: fmt[0] for fmt in date_formats}
+        self.date_format_map = _DATE_FORMAT_BY_NAME
+        self.date_format_map_reverse = _DATE_NAME_BY_FORMAT
 
-        current_date_format = self.config.get('display', 'date_format') or "%A, %B %d"
-        current_format_name = self.date_format_map_reverse.get(current_date_format, date_formats[0][0])
+        current_date_format = self._cfg['display']['date_format'] or "%A, %B %d"
+        current_format_name = self.date_format_map_reverse.get(current_date_format, _DATE_FORMATS[0][0])
 
         self.date_format_var = tk.StringVar(value=current_format_name)
         date_format_combo = ttk.Combobox(tab, textvariable=self.date_format_var,
-                                         values=[fmt[0] for fmt in date_formats],
+                                         values=_DATE_FORMAT_NAMES,
                                          state="readonly", width=30)
         date_format_combo.grid(row=4, column=0, sticky="w", padx=10, pady=5)
         date_format_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_instant_preview())
@@ -924,7 +941,7 @@ class SettingsWindow:
             row=5, column=0, sticky="w", padx=10, pady=(20, 5)
         )
 
-        self.hourly_chime_var = tk.BooleanVar(value=self.config.get('display', 'hourly_chime'))
+        self.hourly_chime_var = tk.BooleanVar(value=self._cfg['display']['hourly_chime'])
         ttk.Checkbutton(tab, text="Play sound at top of each hour", variable=self.hourly_chime_var).grid(
             row=6, column=0, sticky="w", padx=10, pady=5
         )
@@ -934,7 +951,7 @@ class SettingsWindow:
             row=7, column=0, sticky="w", padx=10, pady=(20, 5)
         )
 
-        self.snap_to_edges_var = tk.BooleanVar(value=self.config.get('display', 'snap_to_edges'))
+        self.snap_to_edges_var = tk.BooleanVar(value=self._cfg['display']['snap_to_edges'])
         snap_check = ttk.Checkbutton(tab, text="Snap to screen edges", variable=self.snap_to_edges_var)
         snap_check.grid(row=8, column=0, sticky="w", padx=10, pady=5)
         ToolTip(snap_check, "Widget snaps to screen edges when dragged nearby")
@@ -944,7 +961,7 @@ class SettingsWindow:
             row=9, column=0, sticky="w", padx=10, pady=(20, 5)
         )
 
-        self.launch_at_boot_var = tk.BooleanVar(value=self.config.get('display', 'launch_at_boot'))
+        self.launch_at_boot_var = tk.BooleanVar(value=self._cfg['display']['launch_at_boot'])
         ttk.Checkbutton(tab, text="Launch at Windows Startup", variable=self.launch_at_boot_var).grid(
             row=10, column=0, sticky="w", padx=10, pady=5
         )
@@ -954,8 +971,8 @@ class SettingsWindow:
             row=11, column=0, sticky="w", padx=10, pady=(20, 5)
         )
 
-        current_x = self.config.get('position', 'x')
-        current_y = self.config.get('position', 'y')
+        current_x = self._cfg['position']['x']
+        current_y = self._cfg['position']['y']
         ttk.Label(tab, text=f"Current: X={current_x}, Y={current_y}", font=("Segoe UI", 9)).grid(
             row=12, column=0, sticky="w", padx=10, pady=5
         )
@@ -999,21 +1016,16 @@ class SettingsWindow:
             # Hide individual colors
             self.individual_colors_frame.grid_remove()
             # Sync all individual colors to master text color
-            master_color = self.text_color_var.get()
-            self.time_color_var.set(master_color)
-            self.date_color_var.set(master_color)
-            self.weather_color_var.set(master_color)
-            self.time_color_btn.config(bg=master_color)
-            self.date_color_btn.config(bg=master_color)
-            self.weather_color_btn.config(bg=master_color)
+            self._sync_child_colors(self.text_color_var.get())
         else:
             # Show individual colors
             self.individual_colors_frame.grid()
 
-        self.apply_instant_preview()
+        self._schedule_preview()
 
-    def on_hex_color_change(self, color_type, color_var, button):
+    def on_hex_color_change(self, color_type):
         """Handle hex color entry changes with validation."""
+        color_var, _, button = self._color_widgets[color_type]
         hex_value = color_var.get().strip()
 
         # Validate hex color format
@@ -1021,18 +1033,13 @@ class SettingsWindow:
             try:
                 # Test if it's a valid hex color
                 int(hex_value[1:], 16)
-                button.config(bg=hex_value)
+                self._set_button_color(button, hex_value)
 
                 # If colors are locked and text color changes, sync to all
                 if color_type == 'text' and self.lock_colors_var.get():
-                    self.time_color_var.set(hex_value)
-                    self.date_color_var.set(hex_value)
-                    self.weather_color_var.set(hex_value)
-                    self.time_color_btn.config(bg=hex_value)
-                    self.date_color_btn.config(bg=hex_value)
-                    self.weather_color_btn.config(bg=hex_value)
+                    self._sync_child_colors(hex_value)
 
-                self.apply_instant_preview()
+                self._schedule_preview()
             except ValueError:
                 pass  # Invalid hex, ignore
         elif not hex_value.startswith('#') and len(hex_value) == 6:
@@ -1041,123 +1048,245 @@ class SettingsWindow:
             try:
                 int(hex_value[1:], 16)
                 color_var.set(hex_value)
-                button.config(bg=hex_value)
+                self._set_button_color(button, hex_value)
 
                 # If colors are locked and text color changes, sync to all
                 if color_type == 'text' and self.lock_colors_var.get():
-                    self.time_color_var.set(hex_value)
-                    self.date_color_var.set(hex_value)
-                    self.weather_color_var.set(hex_value)
-                    self.time_color_btn.config(bg=hex_value)
-                    self.date_color_btn.config(bg=hex_value)
-                    self.weather_color_btn.config(bg=hex_value)
+                    self._sync_child_colors(hex_value)
 
-                self.apply_instant_preview()
+                self._schedule_preview()
             except ValueError:
                 pass
 
-    def on_center_change(self):
-        """Handle center position changes - moves all elements together."""
+    def _sync_child_colors(self, master_color):
+        """Copy the master text color to the time/date/weather rows, skipping rows already in sync."""
+        for color_type in ('time', 'date', 'weather'):
+            var, _, button = self._color_widgets[color_type]
+            if var.get() != master_color:
+                var.set(master_color)
+            self._set_button_color(button, master_color)
+
+    def _set_button_color(self, button, color):
+        """Set a color button's background, skipping the Tk call when it already shows color."""
+        if self._button_colors.get(button) != color:
+            button.config(bg=color)
+            self._button_colors[button] = color
+
+    def on_center_change(self, value=None):
+        """Handle center position changes - moves all elements together (Scale passes the unused slider value)."""
         # Calculate the offset from previous center
         new_center_x = self.center_x_var.get()
         new_center_y = self.center_y_var.get()
 
-        # Get current time position (our reference point)
-        old_center_x = self.config.get('spacing', 'time_x')
-        old_center_y = self.config.get('spacing', 'time_y')
+        # Get current time position (our reference point); read the variables
+        # rather than the config, which lags behind while a preview is pending
+        old_center_x = self.time_x_var.get()
+        old_center_y = self.time_y_var.get()
 
         # Calculate deltas
         delta_x = new_center_x - old_center_x
         delta_y = new_center_y - old_center_y
 
         # Update all positions
-        self.status_x_var.set(self.status_x_var.get() + delta_x)
-        self.status_y_var.set(self.status_y_var.get() + delta_y)
-        self.time_x_var.set(new_center_x)
-        self.time_y_var.set(new_center_y)
-        self.date_x_var.set(self.date_x_var.get() + delta_x)
-        self.date_y_var.set(self.date_y_var.get() + delta_y)
-        self.weather_x_var.set(self.weather_x_var.get() + delta_x)
-        self.weather_y_var.set(self.weather_y_var.get() + delta_y)
-
-        self.apply_instant_preview()
-
-    def on_spacing_change(self, line_type, value):
+        self._moving_center = True
+        try:
+            self.status_x_var.set(self.status_x_var.get() + delta_x)
+            self.status_y_var.set(self.status_y_var.get() + delta_y)
+            self.time_x_var.set(new_center_x)
+            self.time_y_var.set(new_center_y)
+            self.date_x_var.set(self.date_x_var.get() + delta_x)
+            self.date_y_var.set(self.date_y_var.get() + delta_y)
+            self.weather_x_var.set(self.weather_x_var.get() + delta_x)
+            self.weather_y_var.set(self.weather_y_var.get() + delta_y)
+        finally:
+            self._moving_center = False
+        # The spacing variable traces schedule the (debounced) preview
+
+    def _on_any_var_changed(self, *args):
+        """Trace callback shared by all appearance slider variables."""
+        self._schedule_preview()
+
+    def _on_spacing_var_changed(self, line_type, *args):
+        """Trace callback for spacing variables; ignores writes that match the config."""
+        try:
+            value = self._spacing_vars[line_type].get()
+        except tk.TclError:
+            return  # Entry holds a partial number
+        if value != self.config.get('spacing', line_type):
+            self.on_spacing_change(line_type, value)
+
+    def on_spacing_change(self, line_type, value=None):
         """Handle spacing slider changes (instant preview)."""
         # Make status line visible when adjusting status position
-        if line_type in ['status_x', 'status_y']:
+        if line_type in ['status_x', 'status_y'] and not self._moving_center:
             self.parent_widget.status_text = "[POSITIONING] Adjusting status line position"
             self.parent_widget.update_status_ui()
 
-        self.apply_instant_preview()
+        if value is None:
+            self._schedule_preview()
+        else:
+            self._schedule_preview(changes={('spacing', line_type): value})
 
-    def choose_color(self, color_type, color_var, button):
+    def choose_color(self, color_type):
         """Open color picker and apply color (instant preview)."""
+        color_var, _, button = self._color_widgets[color_type]
         color = colorchooser.askcolor(title=f"Choose {color_type.title()} Color", initialcolor=color_var.get())
         if color[1]:  # color[1] is hex value
             color_var.set(color[1])
-            button.config(bg=color[1])
+            self._set_button_color(button, color[1])
 
             # If colors are locked and text color changes, sync to all
             if color_type == 'text' and self.lock_colors_var.get():
-                self.time_color_var.set(color[1])
-                self.date_color_var.set(color[1])
-                self.weather_color_var.set(color[1])
-                self.time_color_btn.config(bg=color[1])
-                self.date_color_btn.config(bg=color[1])
-                self.weather_color_btn.config(bg=color[1])
+                self._sync_child_colors(color[1])
 
-            self.apply_instant_preview()
+            self._schedule_preview()
 
     def reset_position(self):
         """Reset widget position to default (50, 50)."""
         self.parent_widget.root.geometry("+50+50")
         self.parent_widget.position_changed_since_save = True
 
+    def _schedule_preview(self, delay_ms=50, changes=None):
+        """
+        Coalesce a burst of preview requests into one preview call.
+
+        Args:
+            delay_ms: Debounce delay before the preview runs
+            changes: Optional {(category, key): value} delta; requests without
+                     one fall back to a full apply_instant_preview
+        """
+        self._ensure_snapshot()
+        if self._batch_depth:
+            return  # The batch owner applies one preview for the whole block
+        if changes is None:
+            self._pending_full_preview = True
+        else:
+            self._pending_changes.update(changes)
+        if self._preview_after_id is not None:
+            self.window.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.window.after(delay_ms, self._flush_preview)
+
+    def _flush_preview(self):
+        """Run a debounced preview, skipping it while an entry holds a partial number."""
+        self._preview_after_id = None
+        if not self.window.winfo_viewable():
+            # Keep the pending changes and apply them when the window is mapped again
+            self._preview_deferred = True
+            return
+        self._preview_deferred = False
+        changes, self._pending_changes = self._pending_changes, {}
+        full, self._pending_full_preview = self._pending_full_preview, False
+        try:
+            if full or not changes:
+                self.apply_instant_preview()
+            else:
+                # Only the accumulated keys changed - let the widget apply the delta
+                self._last_preview = None
+                self.config.update_many(changes)
+                self.parent_widget.apply_partial(changes)
+        except tk.TclError:
+            pass
+
+    def _on_window_mapped(self, event):
+        """Apply a preview that was deferred while the window was not viewable."""
+        if event.widget is self.window and self._preview_deferred:
+            self._flush_preview()
+
+    def _cancel_scheduled_preview(self):
+        """Drop any pending debounced preview."""
+        if self._preview_after_id is not None:
+            self.window.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        self._pending_changes = {}
+        self._pending_full_preview = False
+        self._preview_deferred = False
+
     def apply_instant_preview(self):
         """Apply instant preview for appearance settings (hybrid mode)."""
-        # Update config temporarily (not saved to file yet)
-        self.config.set('fonts', 'family', self.font_family_var.get())
-        self.config.set('fonts', 'time_size', self.time_size_var.get())
-        self.config.set('fonts', 'date_size', self.date_size_var.get())
-        self.config.set('fonts', 'weather_size', self.weather_size_var.get())
-
-        self.config.set('colors', 'text', self.text_color_var.get())
-        self.config.set('colors', 'shadow', self.shadow_color_var.get())
-        self.config.set('colors', 'status', self.status_color_var.get())
-        self.config.set('colors', 'lock_colors', self.lock_colors_var.get())
-        self.config.set('colors', 'time_color', self.time_color_var.get())
-        self.config.set('colors', 'date_color', self.date_color_var.get())
-        self.config.set('colors', 'weather_color', self.weather_color_var.get())
-
-        self.config.set('appearance', 'opacity', self.opacity_var.get())
-        self.config.set('appearance', 'scale', self.scale_var.get())
-        self.config.set('appearance', 'shadow_offset_x', self.shadow_offset_x_var.get())
-        self.config.set('appearance', 'shadow_offset_y', self.shadow_offset_y_var.get())
-
-        self.config.set('spacing', 'status_x', self.status_x_var.get())
-        self.config.set('spacing', 'status_y', self.status_y_var.get())
-        self.config.set('spacing', 'time_x', self.time_x_var.get())
-        self.config.set('spacing', 'time_y', self.time_y_var.get())
-        self.config.set('spacing', 'date_x', self.date_x_var.get())
-        self.config.set('spacing', 'date_y', self.date_y_var.get())
-        self.config.set('spacing', 'weather_x', self.weather_x_var.get())
-        self.config.set('spacing', 'weather_y', self.weather_y_var.get())
-
-        self.config.set('display', 'use_24h_format', self.use_24h_var.get())
-        self.config.set('display', 'show_seconds', self.show_seconds_var.get())
-        self.config.set('display', 'snap_to_edges', self.snap_to_edges_var.get())
-
-        # Update date format
-        selected_date_format = self.date_format_var.get()
-        if selected_date_format in self.date_format_map:
-            self.config.set('display', 'date_format', self.date_format_map[selected_date_format])
-
-        # Refresh widget display
-        self.parent_widget.apply_settings()
+        with self._batched_updates():
+            pending = self._stage_preview_to_config()
+
+            # Refresh widget display, unless it already shows exactly these values
+            if pending == self._last_preview:
+                return
+            self._last_preview = pending
+            self.parent_widget.apply_settings()
+
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Group bulk variable/widget updates so they cost one preview.
+
+        Previews that variable traces request inside the block are dropped (the
+        caller applies one itself); redraws are left to the Tk idle loop to coalesce.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+    def _stage_preview_to_config(self):
+        """Write the instant-preview settings to config and return them as a {(category, key): value} dict."""
+        # Applying now supersedes any pending debounced preview
+        self._cancel_scheduled_preview()
+        self._ensure_snapshot()
+
+        # Collect config updates (not saved to file yet) and write them in one pass;
+        # settings on tabs that were never opened are left untouched
+        pending = {}
+        if 'appearance' in self._built_tabs:
+            pending.update({
+                ('fonts', 'family'): self.font_family_var.get(),
+                ('fonts', 'time_size'): self.time_size_var.get(),
+                ('fonts', 'date_size'): self.date_size_var.get(),
+                ('fonts', 'weather_size'): self.weather_size_var.get(),
+
+                ('colors', 'text'): self.text_color_var.get(),
+                ('colors', 'shadow'): self.shadow_color_var.get(),
+                ('colors', 'status'): self.status_color_var.get(),
+                ('colors', 'lock_colors'): self.lock_colors_var.get(),
+                ('colors', 'time_color'): self.time_color_var.get(),
+                ('colors', 'date_color'): self.date_color_var.get(),
+                ('colors', 'weather_color'): self.weather_color_var.get(),
+
+                ('appearance', 'opacity'): self.opacity_var.get(),
+                ('appearance', 'scale'): self.scale_var.get(),
+                ('appearance', 'shadow_offset_x'): self.shadow_offset_x_var.get(),
+                ('appearance', 'shadow_offset_y'): self.shadow_offset_y_var.get()
+            })
+
+        if 'spacing' in self._built_tabs:
+            pending.update({
+                ('spacing', 'status_x'): self.status_x_var.get(),
+                ('spacing', 'status_y'): self.status_y_var.get(),
+                ('spacing', 'time_x'): self.time_x_var.get(),
+                ('spacing', 'time_y'): self.time_y_var.get(),
+                ('spacing', 'date_x'): self.date_x_var.get(),
+                ('spacing', 'date_y'): self.date_y_var.get(),
+                ('spacing', 'weather_x'): self.weather_x_var.get(),
+                ('spacing', 'weather_y'): self.weather_y_var.get()
+            })
+
+        if 'display' in self._built_tabs:
+            pending.update({
+                ('display', 'use_24h_format'): self.use_24h_var.get(),
+                ('display', 'show_seconds'): self.show_seconds_var.get(),
+                ('display', 'snap_to_edges'): self.snap_to_edges_var.get()
+            })
+
+            # Update date format
+            date_format = self.date_format_map.get(self.date_format_var.get())
+            if date_format is not None:
+                pending[('display', 'date_format')] = date_format
+
+        self.config.update_many(pending)
+        return pending
 
     def on_apply(self):
         """Apply all settings including location (manual apply settings)."""
+        self._ensure_snapshot()
+
         # Update location settings
         self.config.set('location', 'zip_code', self.zip_entry.get())
         self.config.set('location', 'country', self.country_entry.get())
@@ -1167,22 +1296,26 @@ class SettingsWindow:
         self.config.set('updates', 'weather_interval', weather_interval_ms)
 
         # Update weather display settings
-        selected_format_name = self.weather_format_var.get()
-        if selected_format_name in self.format_map:
-            self.config.set('weather', 'display_format', self.format_map[selected_format_name])
+        display_format = self.format_map.get(self.weather_format_combo.get())
+        if display_format is not None:
+            self.config.set('weather', 'display_format', display_format)
         self.config.set('weather', 'show_attribution', self.show_weather_attribution_var.get())
         self.config.set('weather', 'show_emoji', self.show_emoji_var.get())
         self.config.set('weather', 'show_forecast', self.show_forecast_var.get())
 
-        # Update sound settings
-        self.config.set('display', 'hourly_chime', self.hourly_chime_var.get())
+        if 'display' in self._built_tabs:
+            # Update sound settings
+            self.config.set('display', 'hourly_chime', self.hourly_chime_var.get())
 
-        # Update launch at boot setting
-        self.config.set('display', 'launch_at_boot', self.launch_at_boot_var.get())
-        self.parent_widget.set_launch_at_boot(self.launch_at_boot_var.get())
+            # Update launch at boot setting (only touch the startup shortcut when it changes)
+            launch_at_boot = self.launch_at_boot_var.get()
+            if launch_at_boot != self.config.get('display', 'launch_at_boot'):
+                self.config.set('display', 'launch_at_boot', launch_at_boot)
+                self.parent_widget.set_launch_at_boot(launch_at_boot)
 
-        # Apply instant preview settings (in case not already applied)
-        self.apply_instant_preview()
+        # Stage instant preview settings (in case not already applied) and redraw once
+        self._last_preview = self._stage_preview_to_config()
+        self.parent_widget.apply_settings()
 
         # Clear status line positioning message
         self.parent_widget.status_text = ""
@@ -1203,15 +1336,19 @@ class SettingsWindow:
         # Hide settings border
         self.parent_widget.show_settings_border(False)
 
-        # Save to file
-        self.config.save()
+        # Save to file (skipped when nothing differs from the last save)
+        if self.config.has_unsaved_changes():
+            self.config.save_async()
         self.window.destroy()
 
     def on_cancel(self):
         """Cancel changes and revert to original settings."""
-        # Restore original config
-        self.config.config = self.original_config
-        self.parent_widget.apply_settings()
+        self._cancel_scheduled_preview()
+
+        # Restore original config (nothing to revert if no edit was made)
+        if self.original_config is not None:
+            self.config.config = self.original_config
+            self.parent_widget.apply_settings()
 
         # Clear status line positioning message
         self.parent_widget.status_text = ""
@@ -1231,6 +1368,7 @@ class SettingsWindow:
         )
 
         if response:
+            self._cancel_scheduled_preview()
             self.config.reset_to_defaults()
             self.parent_widget.apply_settings()
 
@@ -1243,19 +1381,20 @@ class SettingsWindow:
 
             self.window.destroy()
 
+    def _snapshot_config(self):
+        """Shallow-copy each config section into a plain dict for fast reads."""
+        return {category: dict(values) for category, values in self.config.get_all().items()
+                if isinstance(values, dict)}
+
     def _deep_copy_config(self):
         """Create a deep copy of current config for cancel/revert."""
-        config_dict = self.config.get_all()
-        return self._deep_copy_dict(config_dict)
-
-    def _deep_copy_dict(self, obj):
-        """Simple deep copy for nested dictionaries."""
-        if isinstance(obj, dict):
-            return {k: self._deep_copy_dict(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deep_copy_dict(item) for item in obj]
-        else:
-            return obj
+        # A json round-trip, so the snapshot holds only what settings.json can store
+        return json.loads(json.dumps(self.config.get_all()))
+
+    def _ensure_snapshot(self):
+        """Snapshot the config for cancel/revert before the first change is written."""
+        if self.original_config is None:
+            self.original_config = self._deep_copy_config()
 
     def on_theme_selected(self, event=None):
         """Handle theme selection from dropdown."""
@@ -1265,46 +1404,35 @@ class SettingsWindow:
             return  # Don't apply anything for Custom
 
         # Find theme ID by name
-        theme_id = None
-        for tid, theme in THEMES.items():
-            if theme["name"] == selected_name:
-                theme_id = tid
-                break
+        theme_id = THEME_NAME_TO_ID.get(selected_name)
 
         if theme_id:
             # Apply theme to config
+            self._ensure_snapshot()
             apply_theme_to_config(self.config, theme_id)
 
             # Update UI variables to match theme
             theme = get_theme(theme_id)
 
-            # Update color variables
-            if "colors" in theme:
-                self.text_color_var.set(theme["colors"].get("text", "#ffffff"))
-                self.shadow_color_var.set(theme["colors"].get("shadow", "#000000"))
-                self.status_color_var.set(theme["colors"].get("status", "#808080"))
-                self.time_color_var.set(theme["colors"].get("time_color", "#ffffff"))
-                self.date_color_var.set(theme["colors"].get("date_color", "#ffffff"))
-                self.weather_color_var.set(theme["colors"].get("weather_color", "#ffffff"))
-
-                # Update color buttons
-                self.text_color_btn.config(bg=self.text_color_var.get())
-                self.shadow_color_btn.config(bg=self.shadow_color_var.get())
-                self.status_color_btn.config(bg=self.status_color_var.get())
-                self.time_color_btn.config(bg=self.time_color_var.get())
-                self.date_color_btn.config(bg=self.date_color_var.get())
-                self.weather_color_btn.config(bg=self.weather_color_var.get())
-
-            # Update font family
-            if "fonts" in theme:
-                self.font_family_var.set(theme["fonts"].get("family", "Segoe UI"))
-
-            # Update opacity
-            if "appearance" in theme:
-                self.opacity_var.set(theme["appearance"].get("opacity", 1.0))
-
-            # Apply preview
-            self.apply_instant_preview()
+            with self._batched_updates():
+                # Update color variables
+                if "colors" in theme:
+                    colors = theme["colors"]
+                    for var, button, key in self._color_bindings:
+                        value = colors.get(key, _THEME_COLOR_DEFAULTS.get(key, "#ffffff"))
+                        var.set(value)
+                        self._set_button_color(button, value)
+
+                # Update font family
+                if "fonts" in theme:
+                    self.font_family_var.set(theme["fonts"].get("family", "Segoe UI"))
+
+                # Update opacity
+                if "appearance" in theme:
+                    self.opacity_var.set(theme["appearance"].get("opacity", 1.0))
+
+                # Apply preview
+                self.apply_instant_preview()
 
     def export_settings(self):
         """Export current settings to a JSON file."""
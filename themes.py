@@ -3,6 +3,9 @@ Theme Presets for TimeDateWeather Desktop Widget.
 Provides pre-configured color and font combinations for quick styling.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 THEMES = {
     "default": {
         "name": "Default",
@@ -78,7 +81,18 @@ THEMES = {
     }
 }
 
+# Themes are read-only presets; expose them as views so callers never need to copy
+THEMES = MappingProxyType({
+    tid: MappingProxyType({k: MappingProxyType(v) if isinstance(v, dict) else v
+                           for k, v in theme.items()})
+    for tid, theme in THEMES.items()
+})
+
+# Display name -> theme ID, built once for dropdown lookups
+THEME_NAME_TO_ID = {t["name"]: tid for tid, t in THEMES.items()}
+
 
+@lru_cache(maxsize=None)
 def get_theme(theme_id):
     """
     Get a theme by its ID.
@@ -129,22 +143,15 @@ def apply_theme_to_config(config, theme_id):
 
     theme = THEMES[theme_id]
 
-    # Apply colors
-    if "colors" in theme:
-        for key, value in theme["colors"].items():
-            config.set("colors", key, value)
-
-    # Apply fonts
-    if "fonts" in theme:
-        for key, value in theme["fonts"].items():
-            config.set("fonts", key, value)
-
-    # Apply appearance
-    if "appearance" in theme:
-        for key, value in theme["appearance"].items():
-            config.set("appearance", key, value)
+    # Collect colors, fonts and appearance, then write them in one pass
+    pending = {}
+    for category in ("colors", "fonts", "appearance"):
+        if category in theme:
+            pending.update({(category, key): value for key, value in theme[category].items()})
 
     # Set the theme identifier
-    config.set("appearance", "theme", theme_id)
+    pending[("appearance", "theme")] = theme_id
+
+    config.update_many(pending)
 
     return True
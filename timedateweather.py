@@ -1,41 +1,102 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import font as tkfont
 import time
 import threading
-import urllib.request
-import json
+import queue
 import ctypes
+from ctypes import wintypes
 import os
 import sys
-import winsound
 from config_manager import ConfigManager
 
 # Application version
 APP_VERSION = "1.0.0"
 
+# This script's location, resolved once (before anything can change the working directory)
+SCRIPT_PATH = os.path.abspath(__file__)
+SCRIPT_DIR = os.path.dirname(SCRIPT_PATH)
+
+# Weather service host (wttr.in, free, no API key required)
+WEATHER_HOST = "wttr.in"
+
+# Weather emoji, named once so condition aliases share the same string
+_SUN = "\u2600\ufe0f"                   # Sun
+_SUN_CLOUD = "\u26c5"                    # Sun behind cloud
+_CLOUD = "\u2601\ufe0f"                 # Cloud
+_FOG = "\ud83c\udf2b\ufe0f"             # Fog
+_RAIN = "\ud83c\udf27\ufe0f"            # Cloud with rain
+_SUN_RAIN = "\ud83c\udf26\ufe0f"        # Sun behind rain cloud
+_THUNDER = "\u26c8\ufe0f"               # Thunder cloud
+_SNOWFLAKE = "\u2744\ufe0f"             # Snowflake
+_CLOUD_SNOW = "\ud83c\udf28\ufe0f"      # Cloud with snow
+_WIND = "\ud83d\udca8"                  # Dash (wind)
+_THERMOMETER = "\ud83c\udf21\ufe0f"     # Thermometer
+
 # Weather condition to emoji mapping
 WEATHER_EMOJIS = {
-    "sunny": "\u2600\ufe0f",      # Sun
-    "clear": "\u2600\ufe0f",      # Sun (for clear day)
-    "partly cloudy": "\u26c5",    # Sun behind cloud
-    "cloudy": "\u2601\ufe0f",     # Cloud
-    "overcast": "\u2601\ufe0f",   # Cloud
-    "mist": "\ud83c\udf2b\ufe0f", # Fog
-    "fog": "\ud83c\udf2b\ufe0f",  # Fog
-    "light rain": "\ud83c\udf27\ufe0f",   # Cloud with rain
-    "rain": "\ud83c\udf27\ufe0f",         # Cloud with rain
-    "heavy rain": "\ud83c\udf27\ufe0f",   # Cloud with rain
-    "drizzle": "\ud83c\udf26\ufe0f",      # Sun behind rain cloud
-    "thunderstorm": "\u26c8\ufe0f",       # Thunder cloud
-    "thunder": "\u26c8\ufe0f",            # Thunder cloud
-    "snow": "\u2744\ufe0f",               # Snowflake
-    "light snow": "\ud83c\udf28\ufe0f",   # Cloud with snow
-    "heavy snow": "\u2744\ufe0f",         # Snowflake
-    "sleet": "\ud83c\udf28\ufe0f",        # Cloud with snow
-    "hail": "\ud83c\udf28\ufe0f",         # Cloud with snow
-    "windy": "\ud83d\udca8",              # Dash (wind)
-    "hot": "\ud83c\udf21\ufe0f",          # Thermometer
-    "cold": "\u2744\ufe0f",               # Snowflake
+    "sunny": _SUN,
+    "clear": _SUN,              # Clear day
+    "partly cloudy": _SUN_CLOUD,
+    "cloudy": _CLOUD,
+    "overcast": _CLOUD,
+    "mist": _FOG,
+    "fog": _FOG,
+    "light rain": _RAIN,
+    "rain": _RAIN,
+    "heavy rain": _RAIN,
+    "drizzle": _SUN_RAIN,
+    "thunderstorm": _THUNDER,
+    "thunder": _THUNDER,
+    "snow": _SNOWFLAKE,
+    "light snow": _CLOUD_SNOW,
+    "heavy snow": _SNOWFLAKE,
+    "sleet": _CLOUD_SNOW,
+    "hail": _CLOUD_SNOW,
+    "windy": _WIND,
+    "hot": _THERMOMETER,
+    "cold": _SNOWFLAKE,
+}
+
+# (condition, emoji) pairs in match-priority order for the substring scan
+_WEATHER_EMOJI_ITEMS = tuple(WEATHER_EMOJIS.items())
+
+# Win32 calls used by make_click_through and ensure_on_screen, resolved once with explicit signatures
+# (_user32 is None where user32 is unavailable, and those callers fall back to plain Tk)
+try:
+    _user32 = ctypes.windll.user32
+    _GetParent = _user32.GetParent
+    _GetParent.argtypes = [wintypes.HWND]
+    _GetParent.restype = wintypes.HWND
+    _GetWindowLongW = _user32.GetWindowLongW
+    _GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongW.restype = wintypes.LONG
+    _SetWindowLongW = _user32.SetWindowLongW
+    _SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    _SetWindowLongW.restype = wintypes.LONG
+    _GetSystemMetrics = _user32.GetSystemMetrics
+    _GetSystemMetrics.argtypes = [ctypes.c_int]
+    _GetSystemMetrics.restype = ctypes.c_int
+except (AttributeError, OSError):
+    _user32 = None
+GWL_EXSTYLE = -20
+
+# Widgets currently open in this process (they share one Tk root and mainloop)
+_open_widgets = set()
+
+# Weather responses shared by every widget in the process: request path -> (time.monotonic(), text).
+# A per-path lock lets the first widget fetch while others asking for the same path wait for its result.
+_weather_cache = {}
+_weather_path_locks = {}
+_weather_cache_lock = threading.Lock()
+
+# strftime patterns keyed by (use_24h, show_seconds); the 12-hour hour drops its
+# leading zero (e.g., "2:30 PM"), spelled "%#I" on Windows and "%-I" elsewhere
+_HOUR_12 = "%#I" if sys.platform == "win32" else "%-I"
+TIME_FORMATS = {
+    (True, True): "%H:%M:%S",
+    (True, False): "%H:%M",
+    (False, True): _HOUR_12 + ":%M:%S %p",
+    (False, False): _HOUR_12 + ":%M %p",
 }
 
 # ==========================================
@@ -49,12 +110,16 @@ WEATHER_EMOJIS = {
 # ==========================================
 
 class DesktopWidget:
-    def __init__(self, instance_id="instance_1", is_new=False):
-        self.root = tk.Tk()
+    def __init__(self, instance_id="instance_1", is_new=False, master=None, config=None):
+        # master: a Toplevel to build into, for extra widgets sharing this process's Tk root
+        # config: an already-loaded ConfigManager for this instance, to skip re-reading settings.json
+        self.root = tk.Tk() if master is None else master
+        self._tk_root = self.root if master is None else master.master
         self.instance_id = instance_id
 
         # Load configuration for this instance
-        self.config = ConfigManager(instance_id=instance_id)
+        self.config = config if config is not None else ConfigManager(instance_id=instance_id)
+        get = self.config.get  # Local alias for the many lookups below
 
         # Track if this is a newly created instance
         self.is_new_instance = is_new
@@ -62,27 +127,49 @@ class DesktopWidget:
         # Track position changes for smart exit dialog
         self.position_changed_since_save = False
         self.last_saved_position = (
-            self.config.get('position', 'x'),
-            self.config.get('position', 'y')
+            get('position', 'x'),
+            get('position', 'y')
         )
 
-        self.weather_text = f"Loading {self.config.get('location', 'zip_code')} Weather"
+        self.weather_text = f"Loading {get('location', 'zip_code')} Weather"
         self.status_text = "Drag to position - Right-click for menu"  # Status messages line
         self.is_locked = False  # Start unlocked for positioning
         self.is_topmost = False  # Start at desktop level
-        self.use_24h = self.config.get('display', 'use_24h_format')  # Time format preference
-        self.show_seconds = self.config.get('display', 'show_seconds')  # Show seconds preference
+        self.use_24h = get('display', 'use_24h_format')  # Time format preference
+        self.show_seconds = get('display', 'show_seconds')  # Show seconds preference
+        self._time_fmt = TIME_FORMATS[(self.use_24h, self.show_seconds)]
         self.settings_border_visible = False  # Track if settings border is shown
         self.last_hour_chimed = -1  # Track last hour we played chime for
+        self._time_after_id = None  # Pending update_time tick
+        self._chime_after_id = None  # Pending top-of-hour chime check
+        self._weather_after_id = None  # Pending periodic weather refresh
+        self._closed = False  # Set once this widget's window has been closed
+        self._pulse_after_id = None  # Pending new-instance highlight pulse
+        self._status_after_id = None  # Pending status-line clear
+        self._hwnd = None  # Win32 frame handle, resolved on first make_click_through
+        self._font_specs = {}  # Font attribute name -> (family, size, weight) last applied
+        self._visible = True  # False while the window is unmapped (clock and pulse paused)
+        self._http = [None, None]  # Kept-alive HTTPS connections by slot (weather worker, forecast helper)
+        self._weather_pool = None  # One-thread executor for the concurrent forecast request
+        self._weather_queue = queue.Queue()  # Weather refresh requests for the worker thread
         self.drag_start_x = 0
         self.drag_start_y = 0
+        self._pending_geom = None  # Latest drag position not yet applied
+        self._screen_size = None  # (width, height) read when the current drag started
+        self._drag_after_id = None  # Pending idle geometry flush
+        self.shadow_ids = {}  # Main text item id -> its shadow item id
+        self._line_states = {}  # Line name -> geometry/style last applied in place
+        self._last_time_str = None  # Last strings written to the canvas items
+        self._last_date_str = None
+        self._last_weather_text = None
+        self._cache_config()  # Config values read on every tick / text draw
 
         # Window Setup
         self.root.overrideredirect(True)  # Remove borders
         self.root.geometry(f"+{self.last_saved_position[0]}+{self.last_saved_position[1]}")
         self.root.attributes("-topmost", False) # Keep on desktop level
         self.root.wm_attributes("-transparentcolor", "black") # Magic color for transparency
-        self.root.attributes("-alpha", self.config.get('appearance', 'opacity'))
+        self.root.attributes("-alpha", get('appearance', 'opacity'))
 
         # Set window title for instance identification (useful for debugging)
         self.root.title(f"TimeDateWeather - {instance_id}")
@@ -93,51 +180,37 @@ class DesktopWidget:
         except Exception:
             pass
 
-        # Create context menu with keyboard shortcut hints
-        self.context_menu = tk.Menu(self.root, tearoff=0)
+        # Context menu state; the menu itself is built on the first right-click
+        self.context_menu = None
         self.lock_var = tk.BooleanVar(value=False)
         self.topmost_var = tk.BooleanVar(value=False)
-        self.time_24h_var = tk.BooleanVar(value=self.config.get('display', 'use_24h_format'))
-        self.show_seconds_var = tk.BooleanVar(value=self.config.get('display', 'show_seconds'))
-        self.context_menu.add_command(label="Refresh Weather (Ctrl+R)", command=self.manual_weather_refresh)
-        self.context_menu.add_separator()
-        self.context_menu.add_checkbutton(label="Lock Position (Ctrl+L)", variable=self.lock_var, command=self.toggle_lock)
-        self.context_menu.add_checkbutton(label="Keep on Top", variable=self.topmost_var, command=self.toggle_topmost)
-        self.context_menu.add_checkbutton(label="24-Hour Format", variable=self.time_24h_var, command=self.toggle_time_format)
-        self.context_menu.add_checkbutton(label="Show Seconds", variable=self.show_seconds_var, command=self.toggle_show_seconds)
-        self.context_menu.add_separator()
-        self.context_menu.add_command(label="Settings... (Ctrl+S)", command=self.open_settings)
-        self.context_menu.add_command(label="About...", command=self.show_about)
-        self.context_menu.add_separator()
-        self.context_menu.add_command(label="Launch New Instance", command=self.launch_new_instance)
-        self.context_menu.add_command(label="Exit This Instance", command=self.on_exit)
-        self.context_menu.add_command(label="Exit All Instances", command=self.exit_all_instances)
+        self.time_24h_var = tk.BooleanVar(value=get('display', 'use_24h_format'))
+        self.show_seconds_var = tk.BooleanVar(value=get('display', 'show_seconds'))
 
         # Highlight border reference
         self.highlight_border = None
 
-        # Drag and lock bindings
-        self.root.bind("<Button-1>", self.start_drag)
-        self.root.bind("<B1-Motion>", self.on_drag)
-        self.root.bind("<ButtonRelease-1>", self.end_drag)  # Save position on drag end
-        self.root.bind("<Button-3>", self.show_context_menu)  # Right-click for menu
-
         # Keyboard shortcuts
         self.root.bind("<Control-l>", self.toggle_lock)  # Ctrl+L to lock/unlock
         self.root.bind("<Control-r>", lambda e: self.manual_weather_refresh())  # Ctrl+R to refresh weather
         self.root.bind("<Control-s>", lambda e: self.open_settings())  # Ctrl+S for settings
 
+        # Pause the clock while the window is unmapped and resume it on remap
+        self.root.bind("<Unmap>", self._on_unmap)
+        self.root.bind("<Map>", self._on_map)
+
         # Exit handler for smart position save dialog
         self.root.protocol("WM_DELETE_WINDOW", self.on_exit)
 
         # UI Elements (Using Canvas for text shadows/rendering)
         # Calculate canvas size based on scale and font size
-        self.scale = self.config.get('appearance', 'scale')
+        self.scale = get('appearance', 'scale')
+        self._build_fonts()
 
         # Calculate font-based scale factor
-        time_size = self.config.get('fonts', 'time_size')
-        date_size = self.config.get('fonts', 'date_size')
-        weather_size = self.config.get('fonts', 'weather_size')
+        time_size = get('fonts', 'time_size')
+        date_size = get('fonts', 'date_size')
+        weather_size = get('fonts', 'weather_size')
         max_font_size = max(time_size, date_size, weather_size)
         font_scale_factor = max(1.0, max_font_size / 48.0)
         total_scale = self.scale * font_scale_factor
@@ -147,115 +220,143 @@ class DesktopWidget:
         self.canvas = tk.Canvas(self.root, bg="black", highlightthickness=0, width=self.canvas_width, height=self.canvas_height)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
-        # Create invisible rectangle covering entire canvas to catch all mouse events
-        self.canvas.create_rectangle(0, 0, self.canvas_width, self.canvas_height, fill="black", outline="", tags="clickarea")
-
-        # Bind ALL canvas events for complete coverage
-        # Use bind_all on canvas to catch events even when they hit text
-        self.canvas.bind("<Button-1>", self.start_drag, add="+")
-        self.canvas.bind("<B1-Motion>", self.on_drag, add="+")
-        self.canvas.bind("<ButtonRelease-1>", self.end_drag, add="+")
-        self.canvas.bind("<Button-3>", self.show_context_menu, add="+")
-
-        # Also bind to the clickarea rectangle
-        self.canvas.tag_bind("clickarea", "<Button-1>", self.start_drag, add="+")
-        self.canvas.tag_bind("clickarea", "<B1-Motion>", self.on_drag, add="+")
-        self.canvas.tag_bind("clickarea", "<ButtonRelease-1>", self.end_drag, add="+")
-        self.canvas.tag_bind("clickarea", "<Button-3>", self.show_context_menu, add="+")
-
-        # Bind to ALL canvas items (catch everything)
-        self.canvas.tag_bind("all", "<Button-3>", self.show_context_menu, add="+")
-        self.canvas.tag_bind("text", "<Button-1>", self.start_drag, add="+")
-        self.canvas.tag_bind("text", "<B1-Motion>", self.on_drag, add="+")
-        self.canvas.tag_bind("text", "<ButtonRelease-1>", self.end_drag, add="+")
-        self.canvas.tag_bind("shadow", "<Button-3>", self.show_context_menu, add="+")
-        self.canvas.tag_bind("shadow", "<Button-1>", self.start_drag, add="+")
-        self.canvas.tag_bind("shadow", "<B1-Motion>", self.on_drag, add="+")
-        self.canvas.tag_bind("shadow", "<ButtonRelease-1>", self.end_drag, add="+")
+        # Drag and context menu bindings: widget-level canvas bindings see clicks
+        # anywhere on the canvas, so no click-catching item or per-tag bindings are needed
+        self.canvas.bind("<Button-1>", self.start_drag)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.end_drag)  # Save position on drag end
+        self.canvas.bind("<Button-3>", self.show_context_menu)  # Right-click for menu
 
         # Draw Text placeholders with proper spacing (scaled)
+        spacing = get('spacing')
+        scale = self.scale
+        colors = get('colors')
+        locked = colors.get('lock_colors')  # Individual line colors apply only when unlocked
         # Status message appears at top (small, subtle)
         self.status_id = self.create_status_text(
-            int(self.config.get('spacing', 'status_x') * self.scale),
-            int(self.config.get('spacing', 'status_y') * self.scale),
+            int(spacing['status_x'] * scale),
+            int(spacing['status_y'] * scale),
             self.status_text
         )
         # Time display (large, bold)
-        time_color = self.config.get('colors', 'time_color') if not self.config.get('colors', 'lock_colors') else None
         self.time_id = self.create_text(
-            int(self.config.get('spacing', 'time_x') * self.scale),
-            int(self.config.get('spacing', 'time_y') * self.scale),
-            "", self.config.get('fonts', 'time_size'), True, time_color
+            int(spacing['time_x'] * scale),
+            int(spacing['time_y'] * scale),
+            "", self._time_font, None if locked else colors.get('time_color'), 'time'
         )
         # Date display (medium spacing after time)
-        date_color = self.config.get('colors', 'date_color') if not self.config.get('colors', 'lock_colors') else None
         self.date_id = self.create_text(
-            int(self.config.get('spacing', 'date_x') * self.scale),
-            int(self.config.get('spacing', 'date_y') * self.scale),
-            "", self.config.get('fonts', 'date_size'), False, date_color
+            int(spacing['date_x'] * scale),
+            int(spacing['date_y'] * scale),
+            "", self._date_font, None if locked else colors.get('date_color'), 'date'
         )
         # Weather display (good spacing after date)
-        weather_color = self.config.get('colors', 'weather_color') if not self.config.get('colors', 'lock_colors') else None
         self.weather_id = self.create_text(
-            int(self.config.get('spacing', 'weather_x') * self.scale),
-            int(self.config.get('spacing', 'weather_y') * self.scale),
-            self.weather_text, self.config.get('fonts', 'weather_size'), False, weather_color
+            int(spacing['weather_x'] * scale),
+            int(spacing['weather_y'] * scale),
+            self.weather_text, self._weather_font, None if locked else colors.get('weather_color'), 'weather'
         )
 
+        # Single long-lived worker thread for weather fetches
+        threading.Thread(target=self._weather_worker, daemon=True).start()
+
         # Start loops
         self.update_time()
+        self._chime_and_reschedule()  # Arms the hourly chime timer
         self.get_weather() # Initial call
 
         # Ensure widget is visible on screen (multi-monitor awareness)
         self.root.after(100, self.ensure_on_screen)
 
         # Clear initial status message after 3 seconds
-        self.root.after(3000, self.clear_status_message)
+        self._schedule_status_clear(3000)
 
         # Show highlight for new instances
         if self.is_new_instance:
             self.show_new_instance_highlight()
 
-        self.root.mainloop()
-
-    def create_text(self, x, y, text, size, bold, color=None):
-        # Helper to draw shadow and text on top of clickarea (scaled)
-        scaled_size = int(size * self.scale)
-        shadow_offset_x = int(self.config.get('appearance', 'shadow_offset_x') * self.scale)
-        shadow_offset_y = int(self.config.get('appearance', 'shadow_offset_y') * self.scale)
-        font_spec = (self.config.get('fonts', 'family'), scaled_size, "bold" if bold else "normal")
+        _open_widgets.add(self)
+        if master is None:
+            self.root.mainloop()
+
+    def _cache_config(self):
+        """Mirror config values used on every tick, text draw or drag motion into attributes (refreshed by apply_settings)."""
+        config = self.config
+        self._cfg_date_format = config.get('display', 'date_format') or "%A, %B %d"
+        self._cfg_hourly_chime = config.get('display', 'hourly_chime')
+        self._cfg_weather_interval = config.get('updates', 'weather_interval')
+        self._cfg_font_family = config.get('fonts', 'family')
+        self._cfg_status_size = config.get('fonts', 'status_size')
+        self._cfg_text_color = config.get('colors', 'text')
+        self._cfg_shadow_color = config.get('colors', 'shadow')
+        self._cfg_status_color = config.get('colors', 'status')
+        self._cfg_shadow_offset_x = config.get('appearance', 'shadow_offset_x')
+        self._cfg_shadow_offset_y = config.get('appearance', 'shadow_offset_y')
+        self._cfg_snap_to_edges = config.get('display', 'snap_to_edges')
+        self._cfg_snap_distance = config.get('display', 'snap_distance') or 15
+
+    def _build_fonts(self):
+        """Create or update the named font for each line and the scaled shadow offset (call after self.scale is set)."""
+        get = self.config.get
+        family = self._cfg_font_family
+        for attr, size, weight in (
+            ('_time_font', get('fonts', 'time_size'), "bold"),
+            ('_date_font', get('fonts', 'date_size'), "normal"),
+            ('_weather_font', get('fonts', 'weather_size'), "normal"),
+            ('_status_font', self._cfg_status_size, "normal"),
+        ):
+            spec = (family, int(size * self.scale), weight)
+            if attr not in self._font_specs:
+                setattr(self, attr, tkfont.Font(root=self.root, family=spec[0], size=spec[1], weight=spec[2]))
+            elif self._font_specs[attr] != spec:
+                # Every item using this named font picks up the change without an itemconfigure
+                getattr(self, attr).configure(family=spec[0], size=spec[1], weight=spec[2])
+            self._font_specs[attr] = spec
+        self._shadow_dx = int(self._cfg_shadow_offset_x * self.scale)
+        self._shadow_dy = int(self._cfg_shadow_offset_y * self.scale)
+
+    def create_text(self, x, y, text, font_spec, color=None, line=None):
+        # Helper to draw shadow and text (font_spec is a named font and the shadow offset is prebuilt by _build_fonts)
+        # Both items also carry a "line_<line>" tag so one itemconfigure updates the pair
+        shadow_offset_x = self._shadow_dx
+        shadow_offset_y = self._shadow_dy
 
         # Use provided color or fallback to text color
         if color is None:
-            color = self.config.get('colors', 'text')
+            color = self._cfg_text_color
 
         # Shadow (raise to top layer with shadow tag)
-        shadow = self.canvas.create_text(x+shadow_offset_x, y+shadow_offset_y, text=text, font=font_spec, fill=self.config.get('colors', 'shadow'), anchor="nw", tags=("shadow", f"shadow_{y}"))
+        shadow = self.canvas.create_text(x+shadow_offset_x, y+shadow_offset_y, text=text, font=font_spec, fill=self._cfg_shadow_color, anchor="nw", tags=("shadow", f"line_{line}"),
+                                         state="normal" if (shadow_offset_x, shadow_offset_y) != (0, 0) else "hidden")
         self.canvas.tag_raise(shadow)
         # Main Text (raise to top layer with text tag)
-        text_id = self.canvas.create_text(x, y, text=text, font=font_spec, fill=color, anchor="nw", tags="text")
+        text_id = self.canvas.create_text(x, y, text=text, font=font_spec, fill=color, anchor="nw", tags=("text", f"line_{line}"))
         self.canvas.tag_raise(text_id)
+        self.shadow_ids[text_id] = shadow
         return text_id
 
     def create_status_text(self, x, y, text):
         # Helper to draw status text (no shadow, smaller, 50% opacity gray) (scaled)
-        scaled_size = int(self.config.get('fonts', 'status_size') * self.scale)
-        font_spec = (self.config.get('fonts', 'family'), scaled_size, "normal")
         # Status text overlays time (raise to top layer with text tag)
-        text_id = self.canvas.create_text(x, y, text=text, font=font_spec, fill=self.config.get('colors', 'status'), anchor="nw", tags="text")
+        text_id = self.canvas.create_text(x, y, text=text, font=self._status_font, fill=self._cfg_status_color, anchor="nw", tags="text")
         self.canvas.tag_raise(text_id)
         return text_id
 
     def make_click_through(self, enable=True):
         # Uses Windows API to make the black background transparent AND click-through
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
-        style = ctypes.windll.user32.GetWindowLongW(hwnd, -20) # GWL_EXSTYLE
+        if _user32 is None:
+            return  # No Win32 window styles to change
+        hwnd = self._hwnd
+        if hwnd is None:
+            # The frame window wrapping this toplevel; looked up once per window
+            hwnd = self._hwnd = _GetParent(self.root.winfo_id())
+        style = _GetWindowLongW(hwnd, GWL_EXSTYLE)
         if enable:
             style = style | 0x80000 | 0x20 # WS_EX_LAYERED | WS_EX_TRANSPARENT
         else:
             style = style & ~0x20  # Remove WS_EX_TRANSPARENT
             style = style | 0x80000  # Keep WS_EX_LAYERED
-        ctypes.windll.user32.SetWindowLongW(hwnd, -20, style)
+        _SetWindowLongW(hwnd, GWL_EXSTYLE, style)
 
     def start_drag(self, event):
         # Remove highlight on first interaction
@@ -265,6 +366,8 @@ class DesktopWidget:
         if not self.is_locked:
             self.drag_start_x = event.x
             self.drag_start_y = event.y
+            # Screen size can't change mid-drag; read it once for snap_to_edge
+            self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
 
     def on_drag(self, event):
         if not self.is_locked:
@@ -272,20 +375,53 @@ class DesktopWidget:
             y = self.root.winfo_y() + (event.y - self.drag_start_y)
             # Apply snap-to-edge
             x, y = self.snap_to_edge(x, y)
-            self.root.geometry(f"+{x}+{y}")
+            # Coalesce motion events: only the latest position is applied, once per idle cycle
+            self._pending_geom = (x, y)
+            if self._drag_after_id is None:
+                self._drag_after_id = self.root.after_idle(self._flush_drag_geometry)
             # Mark that position has changed
             self.position_changed_since_save = True
 
+    def _flush_drag_geometry(self):
+        """Move the window to the latest pending drag position."""
+        if self._drag_after_id is not None:
+            self.root.after_cancel(self._drag_after_id)
+            self._drag_after_id = None
+        if self._pending_geom is not None:
+            x, y = self._pending_geom
+            self._pending_geom = None
+            self.root.geometry(f"+{x}+{y}")
+
     def end_drag(self, event):
         """Save position when drag ends (Option C: save on mouse release)."""
+        self._flush_drag_geometry()
         if not self.is_locked and self.position_changed_since_save:
             self.save_current_position()
 
+    def _build_context_menu(self):
+        """Create the right-click menu (with keyboard shortcut hints) on first use."""
+        self.context_menu = tk.Menu(self.root, tearoff=0)
+        self.context_menu.add_command(label="Refresh Weather (Ctrl+R)", command=self.manual_weather_refresh)
+        self.context_menu.add_separator()
+        self.context_menu.add_checkbutton(label="Lock Position (Ctrl+L)", variable=self.lock_var, command=self.toggle_lock)
+        self.context_menu.add_checkbutton(label="Keep on Top", variable=self.topmost_var, command=self.toggle_topmost)
+        self.context_menu.add_checkbutton(label="24-Hour Format", variable=self.time_24h_var, command=self.toggle_time_format)
+        self.context_menu.add_checkbutton(label="Show Seconds", variable=self.show_seconds_var, command=self.toggle_show_seconds)
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="Settings... (Ctrl+S)", command=self.open_settings)
+        self.context_menu.add_command(label="About...", command=self.show_about)
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="Launch New Instance", command=self.launch_new_instance)
+        self.context_menu.add_command(label="Exit This Instance", command=self.on_exit)
+        self.context_menu.add_command(label="Exit All Instances", command=self.exit_all_instances)
+
     def show_context_menu(self, event):
         # Remove highlight on right-click
         if self.is_new_instance:
             self.remove_new_instance_highlight()
 
+        if self.context_menu is None:
+            self._build_context_menu()
         try:
             self.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
@@ -306,7 +442,7 @@ class DesktopWidget:
             self.update_status_ui()
 
             # Clear status message after 3 seconds
-            self.root.after(3000, self.clear_status_message)
+            self._schedule_status_clear(3000)
         else:
             self.root.attributes("-alpha", min(1.0, opacity + 0.15))
             # Show unlocked message on status line
@@ -314,9 +450,16 @@ class DesktopWidget:
             self.update_status_ui()
 
             # Clear status message after 3 seconds
-            self.root.after(3000, self.clear_status_message)
+            self._schedule_status_clear(3000)
+
+    def _schedule_status_clear(self, delay_ms):
+        """Clear the status line after delay_ms, replacing any pending clear."""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(delay_ms, self.clear_status_message)
 
     def clear_status_message(self):
+        self._status_after_id = None
         # Clear the status line
         self.status_text = ""
         self.update_status_ui()
@@ -327,65 +470,91 @@ class DesktopWidget:
 
     def toggle_time_format(self):
         self.use_24h = self.time_24h_var.get()
+        self._time_fmt = TIME_FORMATS[(self.use_24h, self.show_seconds)]
         # Update time display immediately
         self.update_time()
 
     def toggle_show_seconds(self):
         self.show_seconds = self.show_seconds_var.get()
+        self._time_fmt = TIME_FORMATS[(self.use_24h, self.show_seconds)]
         # Update time display immediately
         self.update_time()
 
     def manual_weather_refresh(self):
-        # Manually trigger weather refresh
-        thread = threading.Thread(target=self.fetch_weather_data)
-        thread.daemon = True
-        thread.start()
+        # Manually trigger weather refresh (always fetched fresh, bypassing the shared cache)
+        self._weather_queue.put(True)
+
+    def _on_unmap(self, event):
+        # Toplevel bindings also fire for child widgets; only the window itself counts
+        if event.widget is not self.root:
+            return
+        self._visible = False
+        if self._time_after_id is not None:
+            self.root.after_cancel(self._time_after_id)
+            self._time_after_id = None
+        if self._pulse_after_id is not None:
+            self.root.after_cancel(self._pulse_after_id)
+            self._pulse_after_id = None
+
+    def _on_map(self, event):
+        if event.widget is not self.root or self._visible:
+            return
+        self._visible = True
+        self.update_time()  # Catch up immediately and restart the tick loop
+        if self.is_new_instance and self._pulse_after_id is None:
+            self._pulse_after_id = self.root.after(500, self.pulse_highlight)
 
     def update_time(self):
-        now = time.localtime()
-        # Use 24-hour or 12-hour format based on preference, with or without seconds
-        if self.use_24h:
-            if self.show_seconds:
-                time_str = time.strftime("%H:%M:%S", now)  # 24-hour with seconds (e.g., "14:30:45")
-            else:
-                time_str = time.strftime("%H:%M", now)  # 24-hour without seconds (e.g., "14:30")
-        else:
-            if self.show_seconds:
-                time_str = time.strftime("%I:%M:%S %p", now).lstrip("0")  # 12-hour with seconds (e.g., "2:30:45 PM")
-            else:
-                time_str = time.strftime("%I:%M %p", now).lstrip("0")  # 12-hour without seconds (e.g., "2:30 PM")
+        if not self._visible:
+            return  # Restarted by _on_map
+        timestamp = time.time()
+        now = time.localtime(timestamp)
+        # Format chosen from TIME_FORMATS whenever the preferences change
+        time_str = time.strftime(self._time_fmt, now)
 
         # Use configurable date format
-        date_format = self.config.get('display', 'date_format') or "%A, %B %d"
-        date_str = time.strftime(date_format, now)
-
-        # Check for top of hour chime
-        if self.config.get('display', 'hourly_chime'):
-            current_hour = now.tm_hour
-            current_minute = now.tm_min
-            # Play chime at top of hour (minute 00) and only once per hour
-            if current_minute == 0 and self.last_hour_chimed != current_hour:
-                self.play_hourly_chime()
-                self.last_hour_chimed = current_hour
-
-        # Update Canvas Items with new Y positions
-        self.canvas.itemconfigure(self.time_id, text=time_str)
-        self.canvas.itemconfigure(f"shadow_18", text=time_str)
-
-        self.canvas.itemconfigure(self.date_id, text=date_str)
-        self.canvas.itemconfigure(f"shadow_75", text=date_str)
-
-        self.root.after(self.config.get('updates', 'time_interval'), self.update_time)
+        date_str = time.strftime(self._cfg_date_format, now)
+
+        # Update Canvas Items only when their text actually changed
+        if time_str != self._last_time_str:
+            self.canvas.itemconfigure("line_time", text=time_str)
+            self._last_time_str = time_str
+
+        if date_str != self._last_date_str:
+            self.canvas.itemconfigure("line_date", text=date_str)
+            self._last_date_str = date_str
+
+        # Wake on the next second (or minute, without seconds) boundary; replacing
+        # any pending tick keeps a single loop when called from settings/toggles
+        ms_into_second = int(timestamp * 1000) % 1000
+        if self.show_seconds:
+            delay = 1000 - ms_into_second
+        else:
+            delay = (60 - now.tm_sec) * 1000 - ms_into_second
+        if self._time_after_id is not None:
+            self.root.after_cancel(self._time_after_id)
+        self._time_after_id = self.root.after(delay, self.update_time)
 
     def get_weather(self):
-        # Run in separate thread to prevent GUI freezing
-        thread = threading.Thread(target=self.fetch_weather_data)
-        thread.daemon = True
-        thread.start()
+        # Hand the fetch to the worker thread to prevent GUI freezing
+        self._weather_queue.put(False)
         # Schedule next update
-        self.root.after(self.config.get('updates', 'weather_interval'), self.get_weather)
-
-    def fetch_weather_data(self):
+        self._weather_after_id = self.root.after(self._cfg_weather_interval, self.get_weather)
+
+    def _weather_worker(self):
+        """Worker thread loop: fetch weather for each queued refresh request."""
+        while True:
+            force = self._weather_queue.get()
+            if self._closed:
+                return
+            # Requests that piled up during a fetch are served by a single fetch
+            while not self._weather_queue.empty():
+                force = self._weather_queue.get_nowait() or force
+            self.fetch_weather_data(force)
+
+    def fetch_weather_data(self, force=False):
+        # Periodic refreshes accept a response another widget fetched within half an interval
+        max_age = 0 if force else self._cfg_weather_interval / 2000
         try:
             # Using wttr.in (free, no API key required)
             zip_code = self.config.get('location', 'zip_code')
@@ -394,16 +563,15 @@ class DesktopWidget:
             if self.config.get('weather', 'show_forecast'):
                 # Fetch forecast data (today + tomorrow)
                 forecast_days = self.config.get('weather', 'forecast_days') or 1
-                url = f"https://wttr.in/{zip_code}?format=%C+%t+%w"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req) as response:
-                    today_data = response.read().decode("utf-8").strip()
+                if self._weather_pool is None:
+                    from concurrent.futures import ThreadPoolExecutor
+                    self._weather_pool = ThreadPoolExecutor(max_workers=1)
 
-                # Get tomorrow's forecast
-                url_tomorrow = f"https://wttr.in/{zip_code}?format=%C+%t&1"
-                req_tomorrow = urllib.request.Request(url_tomorrow, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req_tomorrow) as response:
-                    tomorrow_data = response.read().decode("utf-8").strip()
+                # Get tomorrow's forecast on the helper's own connection while today's is fetched here
+                tomorrow_future = self._weather_pool.submit(
+                    self._cached_weather_get, f"/{zip_code}?format=%C+%t&1", max_age, 1)
+                today_data = self._cached_weather_get(f"/{zip_code}?format=%C+%t+%w", max_age)
+                tomorrow_data = tomorrow_future.result()
 
                 data = f"{today_data} | Tomorrow: {tomorrow_data}"
             else:
@@ -412,10 +580,7 @@ class DesktopWidget:
                 format_strings = self.config.get('weather', 'format_strings')
                 format_string = format_strings.get(display_format, "%C+%t+%w")
 
-                url = f"https://wttr.in/{zip_code}?format={format_string}"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req) as response:
-                    data = response.read().decode("utf-8").strip()
+                data = self._cached_weather_get(f"/{zip_code}?format={format_string}", max_age)
 
             # Add weather emoji if enabled
             if self.config.get('weather', 'show_emoji'):
@@ -426,41 +591,95 @@ class DesktopWidget:
             self.weather_text = "Weather Unavailable"
 
         # Schedule UI update on main thread
-        self.root.after(0, self.update_weather_ui)
+        if not self._closed:
+            self.root.after(0, self.update_weather_ui)
+
+    def _cached_weather_get(self, path, max_age, slot=0):
+        """Return the shared cached response for path if younger than max_age seconds, else fetch and cache it."""
+        with _weather_cache_lock:
+            path_lock = _weather_path_locks.setdefault(path, threading.Lock())
+        with path_lock:
+            cached = _weather_cache.get(path)
+            if max_age and cached is not None and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+            text = self._weather_get(path, slot)
+            _weather_cache[path] = (time.monotonic(), text)
+            return text
+
+    def _weather_get(self, path, slot=0):
+        """
+        GET a path from the weather host over a kept-alive, gzip-enabled HTTPS connection.
+
+        Each slot has its own connection, so two threads can fetch at once.
+        A connection the server has dropped is reopened once; HTTP errors raise.
+        """
+        # Imported here, on the worker thread, to keep them off the startup path
+        import http.client
+        import gzip
+
+        conns = self._http
+        for attempt in range(2):
+            if conns[slot] is None:
+                conns[slot] = http.client.HTTPSConnection(WEATHER_HOST, timeout=15)
+            conn = conns[slot]
+            try:
+                conn.request("GET", path, headers={
+                    'User-Agent': 'Mozilla/5.0',
+                    'Accept-Encoding': 'gzip'
+                })
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                conns[slot] = None
+                if attempt:
+                    raise
+
+        if response.status >= 400:
+            raise http.client.HTTPException(f"HTTP {response.status} from {WEATHER_HOST}")
+        if response.getheader('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return body.decode("utf-8").strip()
 
     def _add_weather_emoji(self, weather_text):
         """Add emoji based on weather condition in the text."""
         weather_lower = weather_text.lower()
-        for condition, emoji in WEATHER_EMOJIS.items():
+        for condition, emoji in _WEATHER_EMOJI_ITEMS:
             if condition in weather_lower:
                 return f"{emoji} {weather_text}"
         return weather_text
 
     def update_weather_ui(self):
-        self.canvas.itemconfigure(self.weather_id, text=self.weather_text)
-        self.canvas.itemconfigure(f"shadow_100", text=self.weather_text)
+        if self.weather_text == self._last_weather_text:
+            return
+        self.canvas.itemconfigure("line_weather", text=self.weather_text)
+        self._last_weather_text = self.weather_text
 
     def update_status_ui(self):
         # Update status text only (no shadow for status messages)
         self.canvas.itemconfigure(self.status_id, text=self.status_text)
 
+    def _chime_and_reschedule(self):
+        """Play the hourly chime if enabled, then re-arm for the next top of the hour."""
+        timestamp = time.time()
+        now = time.localtime(timestamp)
+        # Play chime at top of hour (minute 00) and only once per hour; an early
+        # wake-up at :59 just re-arms for the few remaining milliseconds
+        if self._cfg_hourly_chime and now.tm_min == 0 and self.last_hour_chimed != now.tm_hour:
+            self.play_hourly_chime()
+            self.last_hour_chimed = now.tm_hour
+        delay = ((60 - now.tm_min) * 60 - now.tm_sec) * 1000 - int(timestamp * 1000) % 1000
+        self._chime_after_id = self.root.after(delay, self._chime_and_reschedule)
+
     def play_hourly_chime(self):
         """Play a sound notification at the top of the hour."""
         try:
-            # Play system beep in a separate thread to avoid blocking
-            def play_sound():
-                try:
-                    # Play Windows system sound (simple beep)
-                    # Frequency: 1000 Hz, Duration: 200 ms
-                    winsound.Beep(1000, 200)
-                except Exception:
-                    pass  # Silent failure if sound can't play
-
-            thread = threading.Thread(target=play_sound)
-            thread.daemon = True
-            thread.start()
+            import winsound  # Only needed once a chime actually plays
+            # Play the Windows notification sound asynchronously (returns immediately, no thread needed)
+            winsound.PlaySound("SystemNotification", winsound.SND_ALIAS | winsound.SND_ASYNC)
         except Exception:
-            pass  # Silent failure
+            pass  # Silent failure if sound can't play
 
     def open_settings(self):
         """Open the settings window."""
@@ -494,6 +713,7 @@ Features:
   \u2022 Auto-start with Windows
 
 Right-click the widget for quick options."""
+        from tkinter import messagebox  # Dialog modules load only when a dialog is shown
         messagebox.showinfo("About TimeDateWeather", about_text)
 
     def ensure_on_screen(self):
@@ -503,14 +723,19 @@ Right-click the widget for quick options."""
             widget_x = self.root.winfo_x()
             widget_y = self.root.winfo_y()
 
-            # Get virtual screen bounds (all monitors combined) using Windows API
-            user32 = ctypes.windll.user32
-            # SM_XVIRTUALSCREEN = 76, SM_YVIRTUALSCREEN = 77
-            virtual_x = user32.GetSystemMetrics(76)
-            virtual_y = user32.GetSystemMetrics(77)
-            # SM_CXVIRTUALSCREEN = 78, SM_CYVIRTUALSCREEN = 79
-            virtual_width = user32.GetSystemMetrics(78)
-            virtual_height = user32.GetSystemMetrics(79)
+            if _user32 is not None:
+                # Get virtual screen bounds (all monitors combined) using Windows API
+                # SM_XVIRTUALSCREEN = 76, SM_YVIRTUALSCREEN = 77
+                virtual_x = _GetSystemMetrics(76)
+                virtual_y = _GetSystemMetrics(77)
+                # SM_CXVIRTUALSCREEN = 78, SM_CYVIRTUALSCREEN = 79
+                virtual_width = _GetSystemMetrics(78)
+                virtual_height = _GetSystemMetrics(79)
+            else:
+                # No Windows API: use the primary screen as reported by Tk
+                virtual_x = virtual_y = 0
+                virtual_width = self.root.winfo_screenwidth()
+                virtual_height = self.root.winfo_screenheight()
 
             # Ensure at least 100px of widget is visible
             min_visible = 100
@@ -555,34 +780,26 @@ Right-click the widget for quick options."""
 
     def snap_to_edge(self, x, y):
         """Snap widget to screen edges if within snap distance."""
-        if not self.config.get('display', 'snap_to_edges'):
+        if not self._cfg_snap_to_edges or self._screen_size is None:
             return x, y
 
-        snap_distance = self.config.get('display', 'snap_distance') or 15
+        # Screen dimensions as of the start of this drag
+        screen_width, screen_height = self._screen_size
+        d = self._cfg_snap_distance
+        right = screen_width - self.canvas_width    # x that puts the right edge on the screen edge
+        bottom = screen_height - self.canvas_height
 
-        try:
-            # Get screen dimensions
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            widget_width = self.canvas_width
-            widget_height = self.canvas_height
-
-            # Snap to left edge
-            if abs(x) < snap_distance:
-                x = 0
-            # Snap to right edge
-            elif abs(x + widget_width - screen_width) < snap_distance:
-                x = screen_width - widget_width
-
-            # Snap to top edge
-            if abs(y) < snap_distance:
-                y = 0
-            # Snap to bottom edge
-            elif abs(y + widget_height - screen_height) < snap_distance:
-                y = screen_height - widget_height
+        # Snap to left edge, else right edge
+        if -d < x < d:
+            x = 0
+        elif right - d < x < right + d:
+            x = right
 
-        except Exception:
-            pass
+        # Snap to top edge, else bottom edge
+        if -d < y < d:
+            y = 0
+        elif bottom - d < y < bottom + d:
+            y = bottom
 
         return x, y
 
@@ -590,7 +807,7 @@ Right-click the widget for quick options."""
         """Show a temporary status message."""
         self.status_text = message
         self.update_status_ui()
-        self.root.after(duration, self.clear_status_message)
+        self._schedule_status_clear(duration)
 
     def show_settings_border(self, show=True):
         """Show or hide border around canvas when settings menu is open."""
@@ -611,28 +828,24 @@ Right-click the widget for quick options."""
         """Show animated highlight border for new instances."""
         try:
             # Pulsing border to indicate new instance using configurable color
-            highlight_color = self.config.get('ui', 'new_instance_color') or "#00ff00"
-            self.canvas.config(highlightthickness=3, highlightbackground=highlight_color)
+            bright_color = self.config.get('ui', 'new_instance_color') or "#00ff00"
+            dim_color = self.config.get('ui', 'new_instance_color_dim') or "#00aa00"
+            self._pulse_colors = (bright_color, dim_color)
+            self.canvas.config(highlightthickness=3, highlightbackground=bright_color)
             self.highlight_pulse_state = 0
-            self.pulse_highlight()
+            self._pulse_after_id = self.root.after(500, self.pulse_highlight)
         except Exception:
             pass
 
     def pulse_highlight(self):
         """Pulse the highlight border."""
-        if not self.is_new_instance:
-            return
-
         try:
-            # Alternate between bright and dim colors using config
-            bright_color = self.config.get('ui', 'new_instance_color') or "#00ff00"
-            dim_color = self.config.get('ui', 'new_instance_color_dim') or "#00aa00"
-            colors = [bright_color, dim_color, bright_color, dim_color]
-            self.highlight_pulse_state = (self.highlight_pulse_state + 1) % len(colors)
-            self.canvas.config(highlightbackground=colors[self.highlight_pulse_state])
+            # Alternate between the bright and dim colors read when the highlight was shown
+            self.highlight_pulse_state ^= 1
+            self.canvas.config(highlightbackground=self._pulse_colors[self.highlight_pulse_state])
 
-            # Continue pulsing
-            self.root.after(500, self.pulse_highlight)
+            # Continue pulsing (cancelled by remove_new_instance_highlight)
+            self._pulse_after_id = self.root.after(500, self.pulse_highlight)
         except Exception:
             pass
 
@@ -640,6 +853,9 @@ Right-click the widget for quick options."""
         """Remove the new instance highlight."""
         try:
             self.is_new_instance = False
+            if self._pulse_after_id is not None:
+                self.root.after_cancel(self._pulse_after_id)
+                self._pulse_after_id = None
             self.canvas.config(highlightthickness=0)
         except Exception:
             pass
@@ -647,19 +863,26 @@ Right-click the widget for quick options."""
     def apply_settings(self):
         """Apply current config settings to widget (called by settings window for live preview)."""
         try:
+            get = self.config.get
+
+            # Refresh cached config values
+            self._cache_config()
+
             # Update time display preferences
-            self.use_24h = self.config.get('display', 'use_24h_format')
-            self.show_seconds = self.config.get('display', 'show_seconds')
+            self.use_24h = get('display', 'use_24h_format')
+            self.show_seconds = get('display', 'show_seconds')
+            self._time_fmt = TIME_FORMATS[(self.use_24h, self.show_seconds)]
             self.time_24h_var.set(self.use_24h)
             self.show_seconds_var.set(self.show_seconds)
 
             # Update scale and recalculate canvas size dynamically
-            self.scale = self.config.get('appearance', 'scale')
+            self.scale = get('appearance', 'scale')
+            self._build_fonts()
 
             # Calculate additional scale factor based on largest font size
-            time_size = self.config.get('fonts', 'time_size')
-            date_size = self.config.get('fonts', 'date_size')
-            weather_size = self.config.get('fonts', 'weather_size')
+            time_size = get('fonts', 'time_size')
+            date_size = get('fonts', 'date_size')
+            weather_size = get('fonts', 'weather_size')
             max_font_size = max(time_size, date_size, weather_size)
 
             # Base font size is 48 (default time size), scale canvas if fonts are larger
@@ -680,46 +903,11 @@ Right-click the widget for quick options."""
                 self.canvas.config(width=self.canvas_width, height=self.canvas_height)
 
             # Update opacity
-            self.root.attributes("-alpha", self.config.get('appearance', 'opacity'))
-
-            # Recreate text elements with new fonts/colors
-            # This is the most efficient way to update all visual properties
-            self.canvas.delete("all")
-
-            # Recreate clickarea with new size
-            self.canvas.create_rectangle(0, 0, self.canvas_width, self.canvas_height, fill="black", outline="", tags="clickarea")
-
-            # Bind events to new clickarea
-            self.canvas.tag_bind("clickarea", "<Button-1>", self.start_drag)
-            self.canvas.tag_bind("clickarea", "<B1-Motion>", self.on_drag)
-            self.canvas.tag_bind("clickarea", "<ButtonRelease-1>", self.end_drag)
-            self.canvas.tag_bind("clickarea", "<Button-3>", self.show_context_menu)
-
-            # Recreate text elements with scaled positions
-            self.status_id = self.create_status_text(
-                int(self.config.get('spacing', 'status_x') * self.scale),
-                int(self.config.get('spacing', 'status_y') * self.scale),
-                self.status_text
-            )
-            # Use individual colors if unlocked
-            time_color = self.config.get('colors', 'time_color') if not self.config.get('colors', 'lock_colors') else None
-            self.time_id = self.create_text(
-                int(self.config.get('spacing', 'time_x') * self.scale),
-                int(self.config.get('spacing', 'time_y') * self.scale),
-                "", self.config.get('fonts', 'time_size'), True, time_color
-            )
-            date_color = self.config.get('colors', 'date_color') if not self.config.get('colors', 'lock_colors') else None
-            self.date_id = self.create_text(
-                int(self.config.get('spacing', 'date_x') * self.scale),
-                int(self.config.get('spacing', 'date_y') * self.scale),
-                "", self.config.get('fonts', 'date_size'), False, date_color
-            )
-            weather_color = self.config.get('colors', 'weather_color') if not self.config.get('colors', 'lock_colors') else None
-            self.weather_id = self.create_text(
-                int(self.config.get('spacing', 'weather_x') * self.scale),
-                int(self.config.get('spacing', 'weather_y') * self.scale),
-                self.weather_text, self.config.get('fonts', 'weather_size'), False, weather_color
-            )
+            self.root.attributes("-alpha", get('appearance', 'opacity'))
+
+            # Update the existing items in place (no delete/recreate, so no flash)
+            for line, (text_id, font_spec, color) in self._line_styles().items():
+                self._update_line(line, text_id, font_spec, color)
 
             # Force immediate time update to show new settings
             self.update_time()
@@ -728,13 +916,70 @@ Right-click the widget for quick options."""
             # Silent failure
             pass
 
+    def apply_partial(self, changes):
+        """
+        Apply a small set of already-updated settings (called by settings window).
+
+        Spacing changes just move the affected lines; anything else falls back
+        to a full apply_settings().
+
+        Args:
+            changes: Dict of {(category, key): value} that changed
+        """
+        if any(category != 'spacing' for category, _ in changes):
+            self.apply_settings()
+            return
+
+        try:
+            line_styles = self._line_styles()
+            for line in {key.rsplit('_', 1)[0] for _, key in changes}:
+                self._update_line(line, *line_styles[line])
+        except Exception:
+            # Silent failure
+            pass
+
+    def _line_styles(self):
+        """Map each line name to its (item id, font, fill color) under the current settings."""
+        get = self.config.get
+        # Time/date/weather use their individual colors only when colors are unlocked
+        locked = get('colors', 'lock_colors')
+        return {
+            'status': (self.status_id, self._status_font, self._cfg_status_color),
+            'time': (self.time_id, self._time_font,
+                     self._cfg_text_color if locked else get('colors', 'time_color')),
+            'date': (self.date_id, self._date_font,
+                     self._cfg_text_color if locked else get('colors', 'date_color')),
+            'weather': (self.weather_id, self._weather_font,
+                        self._cfg_text_color if locked else get('colors', 'weather_color'))
+        }
+
+    def _update_line(self, line, text_id, font_spec, color):
+        """Move and restyle one text line (and its shadow) in place, skipping it if nothing changed."""
+        spacing = self.config.get('spacing')
+        x = int(spacing[f'{line}_x'] * self.scale)
+        y = int(spacing[f'{line}_y'] * self.scale)
+        shadow_x = x + self._shadow_dx
+        shadow_y = y + self._shadow_dy
+        state = (x, y, shadow_x, shadow_y, font_spec, color, self._cfg_shadow_color)
+        if self._line_states.get(line) == state:
+            return
+        self._line_states[line] = state
+
+        self.canvas.coords(text_id, x, y)
+        self.canvas.itemconfigure(text_id, font=font_spec, fill=color)
+        shadow = self.shadow_ids.get(text_id)
+        if shadow is not None:
+            # A shadow with no offset sits entirely under its text; hide it so Tk skips drawing it
+            shadow_state = "normal" if (shadow_x, shadow_y) != (x, y) else "hidden"
+            self.canvas.coords(shadow, shadow_x, shadow_y)
+            self.canvas.itemconfigure(shadow, font=font_spec, fill=self._cfg_shadow_color, state=shadow_state)
+
     def save_current_position(self):
         """Save current window position to config (silent failure on error)."""
         try:
             x = self.root.winfo_x()
             y = self.root.winfo_y()
-            self.config.set('position', 'x', x)
-            self.config.set('position', 'y', y)
+            self.config.update_many({('position', 'x'): x, ('position', 'y'): y})
             self.config.save()
             # Update tracking variables
             self.last_saved_position = (x, y)
@@ -768,7 +1013,7 @@ Right-click the widget for quick options."""
                 else:
                     # Running as script
                     target_path = sys.executable  # python.exe
-                    arguments = f'"{os.path.abspath(__file__)}"'
+                    arguments = f'"{SCRIPT_PATH}"'
 
                 # Create shortcut
                 shell = Dispatch('WScript.Shell')
@@ -776,7 +1021,7 @@ Right-click the widget for quick options."""
                 shortcut.TargetPath = target_path
                 if not getattr(sys, 'frozen', False):
                     shortcut.Arguments = arguments
-                shortcut.WorkingDirectory = os.path.dirname(os.path.abspath(__file__))
+                shortcut.WorkingDirectory = SCRIPT_DIR
                 shortcut.IconLocation = target_path
                 shortcut.save()
 
@@ -791,7 +1036,7 @@ Right-click the widget for quick options."""
                 if enable:
                     # Create a batch file as fallback
                     batch_path = os.path.join(startup_folder, 'TimeDateWeather.bat')
-                    script_path = os.path.abspath(__file__)
+                    script_path = SCRIPT_PATH
                     with open(batch_path, 'w') as f:
                         if getattr(sys, 'frozen', False):
                             f.write(f'@echo off\nstart "" "{sys.executable}"\n')
@@ -820,21 +1065,15 @@ Right-click the widget for quick options."""
             # Add new instance to config
             self.config.add_instance(new_instance_id)
 
-            # Launch new process with the new instance ID and new flag
-            import subprocess
-            script_path = os.path.abspath(__file__)
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                subprocess.Popen([sys.executable, new_instance_id, "--new"])
-            else:
-                # Running as script
-                subprocess.Popen([sys.executable, script_path, new_instance_id, "--new"])
+            # Open it in this process as a Toplevel of the shared Tk root
+            DesktopWidget(new_instance_id, is_new=True, master=tk.Toplevel(self._tk_root))
         except Exception as e:
             pass  # Silent failure
 
     def exit_all_instances(self):
         """Exit all running instances."""
         try:
+            from tkinter import messagebox
             response = messagebox.askyesno(
                 "Exit All Instances",
                 "Are you sure you want to close all widget instances?",
@@ -843,13 +1082,17 @@ Right-click the widget for quick options."""
 
             if response:
                 # Use taskkill to close all Python processes running this script
-                script_name = os.path.basename(__file__)
                 if getattr(sys, 'frozen', False):
                     # For executable
+                    import subprocess
                     exe_name = os.path.basename(sys.executable)
-                    os.system(f'taskkill /F /IM "{exe_name}" /T')
+                    # Run taskkill directly (no cmd.exe hop, no console flash)
+                    subprocess.run(["taskkill", "/F", "/IM", exe_name, "/T"],
+                                   creationflags=subprocess.CREATE_NO_WINDOW, check=False)
                 else:
-                    self.on_exit()
+                    # All widgets share this process; close each one in turn
+                    for widget in list(_open_widgets):
+                        widget.on_exit()
         except Exception:
             pass
 
@@ -864,6 +1107,7 @@ Right-click the widget for quick options."""
 
             if position_changed:
                 # Show confirmation dialog
+                from tkinter import messagebox
                 response = messagebox.askyesno(
                     "Save Position",
                     "Do you want to save the current widget position?",
@@ -871,60 +1115,74 @@ Right-click the widget for quick options."""
                 )
 
                 if response:  # YES - save current position
-                    self.config.set('position', 'x', current_x)
-                    self.config.set('position', 'y', current_y)
+                    self.config.update_many({('position', 'x'): current_x, ('position', 'y'): current_y})
                     self.config.save()
-                else:  # NO - position will revert to last saved on next launch
-                    pass  # Don't save, config already has last saved position
+                # NO - position will revert to last saved on next launch
+        except Exception:
+            pass  # Silent failure - still close below
 
-            # Exit application
-            self.root.quit()
+        # Close this widget (and the application with the last one)
+        try:
+            self._close()
+        except tk.TclError:
+            pass  # Window already gone
+
+    def _close(self):
+        """Stop this widget's loops and close its window; the Tk root goes with the last widget."""
+        self._closed = True
+        for after_id in (self._time_after_id, self._chime_after_id, self._weather_after_id,
+                         self._drag_after_id, self._pulse_after_id, self._status_after_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self._weather_queue.put(None)  # Wake the worker so it can exit
+        if self._weather_pool is not None:
+            self._weather_pool.shutdown(wait=False)
+        _open_widgets.discard(self)
+
+        if self.root is not self._tk_root:
             self.root.destroy()
-        except Exception:
-            # Silent failure - force quit if any error
-            try:
-                self.root.quit()
-                self.root.destroy()
-            except:
-                pass
+        elif _open_widgets:
+            # Other widgets still live in this Tk root; just hide this one
+            self.root.withdraw()
+            return
+        if not _open_widgets:
+            self._tk_root.quit()
+            self._tk_root.destroy()
 
-def launch_all_active_instances():
-    """Launch all active instances on startup."""
+def launch_all_active_instances(root, config=None):
+    """Open every other active instance as a Toplevel of root (reusing config if it is already loaded)."""
     try:
         # Load config to get active instances
-        config = ConfigManager()
+        if config is None:
+            config = ConfigManager()
         active_instances = config.get_active_instances()
 
-        # Launch each instance in a separate process
-        import subprocess
-        script_path = os.path.abspath(__file__)
-
         for instance_id in active_instances:
             if instance_id != "instance_1":  # Don't relaunch the first one
                 try:
-                    if getattr(sys, 'frozen', False):
-                        subprocess.Popen([sys.executable, instance_id])
-                    else:
-                        subprocess.Popen([sys.executable, script_path, instance_id])
+                    # Built from the already-parsed settings rather than re-reading settings.json
+                    instance_config = ConfigManager(instance_id=instance_id, root_config=config.root_config)
+                    DesktopWidget(instance_id, master=tk.Toplevel(root), config=instance_config)
                 except Exception:
                     pass
     except Exception:
         pass
 
 if __name__ == "__main__":
-    # Check for instance ID argument
-    instance_id = "instance_1"
-    is_new = False
-
-    if len(sys.argv) > 1:
-        instance_id = sys.argv[1]
-        # Check for --new flag
-        if len(sys.argv) > 2 and sys.argv[2] == "--new":
-            is_new = True
-
-    # If this is instance_1, launch all other active instances
+    # Optional instance ID argument, optionally followed by the --new flag
+    args = sys.argv[1:]
+    instance_id = args[0] if args else "instance_1"
+    is_new = len(args) > 1 and args[1] == "--new"
+
+    # One hidden Tk root and mainloop for the process; every widget is a Toplevel of it
+    root = tk.Tk()
+    root.withdraw()
+
+    # Launch this instance; instance_1 also brings up all other active instances,
+    # sharing one settings.json load with them
+    config = ConfigManager(instance_id=instance_id) if instance_id == "instance_1" else None
+    DesktopWidget(instance_id, is_new, master=tk.Toplevel(root), config=config)
     if instance_id == "instance_1":
-        launch_all_active_instances()
+        launch_all_active_instances(root, config)
 
-    # Launch this instance
-    DesktopWidget(instance_id, is_new)
\ No newline at end of file
+    root.mainloop()